@@ -1,14 +1,27 @@
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, MutableMapping, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Dict,
+    List,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import tomli
 import validators
 from pydantic import (
     BaseSettings,
     Extra,
+    Field,
     PostgresDsn,
+    PrivateAttr,
     ValidationError,
     root_validator,
     validator,
@@ -20,6 +33,20 @@ from fideslib.exceptions import MissingConfig
 
 logger = logging.getLogger(__name__)
 
+POOL_CLASSES = [
+    "AssertionPool",
+    "NullPool",
+    "QueuePool",
+    "SingletonThreadPool",
+    "StaticPool",
+]
+# The sizing options each pool class takes, any other pool class takes none
+POOL_SIZING_OPTIONS = {
+    "QueuePool": ("pool_size", "max_overflow", "pool_timeout"),
+    "SingletonThreadPool": ("pool_size",),
+}
+REPLICA_SELECTIONS = ["least_connections", "round_robin"]
+
 
 class FidesSettings(BaseSettings):
     """Class used as a base model for configuration subsections."""
@@ -27,6 +54,8 @@ class FidesSettings(BaseSettings):
     class Config:
         # Need to allow extras because the inheriting class will have more info
         extra = Extra.allow
+        # Loaded configs are cached and shared, use copy(update=...) to change one
+        allow_mutation = False
 
         @classmethod
         def customise_sources(
@@ -52,6 +81,19 @@ class DatabaseSettings(FidesSettings):
     sqlalchemy_database_uri: Optional[str] = None
     sqlalchemy_test_database_uri: Optional[str] = None
 
+    # Connection pool, unset values fall back to the SQLAlchemy defaults
+    pool_class: Optional[str] = None
+    pool_pre_ping: bool = True
+    pool_size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    pool_timeout: Optional[float] = None
+    pool_recycle: Optional[int] = None
+    connect_args: Dict[str, Any] = {}
+
+    # Read replicas, used for SELECTs by sessions outside of test mode
+    sqlalchemy_replica_database_uris: List[str] = []
+    replica_selection: str = "round_robin"
+
     @validator("sqlalchemy_database_uri", pre=True)
     @classmethod
     def assemble_db_connection(cls, v: Optional[str], values: Dict[str, str]) -> str:
@@ -88,6 +130,61 @@ class DatabaseSettings(FidesSettings):
             )
         )
 
+    @validator("pool_class")
+    @classmethod
+    def validate_pool_class(cls, v: Optional[str]) -> Optional[str]:
+        """Validate the pool class is one provided by SQLAlchemy"""
+        if v is not None and v not in POOL_CLASSES:
+            raise ValueError(f"pool_class must be one of {', '.join(POOL_CLASSES)}")
+        return v
+
+    @validator("replica_selection")
+    @classmethod
+    def validate_replica_selection(cls, v: str) -> str:
+        """Validate the replica selection is one that is supported"""
+        if v not in REPLICA_SELECTIONS:
+            raise ValueError(
+                f"replica_selection must be one of {', '.join(REPLICA_SELECTIONS)}"
+            )
+        return v
+
+    @validator("pool_size", "pool_timeout")
+    @classmethod
+    def validate_non_negative(
+        cls, v: Optional[Union[int, float]]
+    ) -> Optional[Union[int, float]]:
+        """Validate the value is not negative"""
+        if v is not None and v < 0:
+            raise ValueError("must not be negative")
+        return v
+
+    @validator("max_overflow", "pool_recycle")
+    @classmethod
+    def validate_negative_one_or_more(cls, v: Optional[int]) -> Optional[int]:
+        """Validate the value is -1, which disables the limit, or more"""
+        if v is not None and v < -1:
+            raise ValueError("must be -1 or more")
+        return v
+
+    @root_validator
+    @classmethod
+    def validate_pool_sizing_options(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate the pool class accepts the sizing options that are set, as only
+        a QueuePool, the default, can be sized and given a timeout
+        """
+        pool_class = values.get("pool_class") or "QueuePool"
+        accepted = POOL_SIZING_OPTIONS.get(pool_class, ())
+        unaccepted = [
+            field
+            for field in ("pool_size", "max_overflow", "pool_timeout")
+            if values.get(field) is not None and field not in accepted
+        ]
+        if unaccepted:
+            raise ValueError(
+                f"{', '.join(unaccepted)} cannot be set when pool_class is {pool_class}"
+            )
+        return values
+
     class Config:
         env_prefix = "FIDES__DATABASE__"
 
@@ -144,7 +241,13 @@ class SecuritySettings(FidesSettings):
     # OAuth
     oauth_root_client_id: str
     oauth_root_client_secret: str
-    oauth_root_client_secret_hash: Optional[Tuple]
+    # Supplied as oauth_root_client_secret_hash, see that property
+    precomputed_oauth_root_client_secret_hash: Optional[Tuple[str, bytes]] = Field(
+        None,
+        alias="oauth_root_client_secret_hash",
+        env="FIDES__SECURITY__OAUTH_ROOT_CLIENT_SECRET_HASH",
+    )
+    _oauth_root_client_secret_hash: Optional[Tuple[str, bytes]] = PrivateAttr(None)
     oauth_access_token_expire_minutes: int = 60 * 24 * 8
     oauth_client_id_length_bytes = 16
     oauth_client_secret_length_bytes = 16
@@ -152,28 +255,84 @@ class SecuritySettings(FidesSettings):
     @root_validator(pre=True)
     @classmethod
     def assemble_root_access_token(cls, values: Dict[str, str]) -> Dict[str, str]:
-        """Sets a hashed value of the root access key.
+        """Validates the root client secret.
 
-        This is hashed as it is not wise to return a plaintext for of the
-        root credential anywhere in the system.
+        The hashed value of the root client secret is not computed here, as that
+        would cost a bcrypt round every time settings are built. Either supply a
+        precomputed `oauth_root_client_secret_hash`, or it will be computed once
+        per process on first use.
         """
         value = values.get("oauth_root_client_secret")
         if not value:
             raise MissingConfig(
                 "oauth_root_client_secret is required", SecuritySettings
             )
+        return values
 
-        encoding = values.get("encoding", "UTF-8")
+    @validator("precomputed_oauth_root_client_secret_hash", pre=True)
+    @classmethod
+    def validate_root_client_secret_hash(
+        cls, v: Optional[Union[List, Tuple]], values: Dict[str, str]
+    ) -> Optional[Tuple[str, bytes]]:
+        """Normalize a precomputed root client secret hash to a (hash, salt) tuple"""
+        if v is None:
+            return v
+        if not isinstance(v, (list, tuple)) or len(v) != 2:
+            raise ValueError(
+                "oauth_root_client_secret_hash must be a [hash, salt] pair"
+            )
 
-        salt = generate_salt()
-        hashed_client_id = hash_with_salt(value.encode(encoding), salt.encode(encoding))
-        values["oauth_root_client_secret_hash"] = (hashed_client_id, salt.encode(encoding))  # type: ignore
-        return values
+        hashed_secret, salt = v
+        if isinstance(salt, str):
+            salt = salt.encode(values.get("encoding", "UTF-8"))
+        return hashed_secret, salt
+
+    @property
+    def oauth_root_client_secret_hash(self) -> Optional[Tuple[str, bytes]]:
+        """The hashed value of the root client secret, as a (hash, salt) tuple,
+        computed on first use unless it was supplied precomputed.
+        """
+        return self.get_oauth_root_client_secret_hash()
+
+    def copy(
+        self, *, update: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> "SecuritySettings":
+        """Copy the settings, computing the root client secret hash again on first
+        use where any values are updated.
+        """
+        copied = super().copy(update=update, **kwargs)
+        if update:
+            copied._oauth_root_client_secret_hash = None
+        return copied
+
+    def get_oauth_root_client_secret_hash(self) -> Optional[Tuple[str, bytes]]:
+        """Returns a hashed value of the root client secret, as a (hash, salt) tuple.
+
+        This is hashed as it is not wise to return a plaintext for of the
+        root credential anywhere in the system.
+        """
+        if self._oauth_root_client_secret_hash is None:
+            if self.precomputed_oauth_root_client_secret_hash is not None:
+                self._oauth_root_client_secret_hash = (
+                    self.precomputed_oauth_root_client_secret_hash
+                )
+            elif self.oauth_root_client_secret:
+                self._oauth_root_client_secret_hash = _hash_root_client_secret(
+                    self.oauth_root_client_secret, self.encoding
+                )
+        return self._oauth_root_client_secret_hash
 
     class Config:
         env_prefix = "FIDES__SECURITY__"
 
 
+@lru_cache(maxsize=None)
+def _hash_root_client_secret(secret: str, encoding: str) -> Tuple[str, bytes]:
+    """Hash the root client secret with a generated salt, once per process."""
+    salt = generate_salt(encoding).encode(encoding)
+    return hash_with_salt(secret.encode(encoding), salt), salt
+
+
 class FidesConfig(FidesSettings):
     """Configuration variables for the FastAPI project."""
 
@@ -233,30 +392,74 @@ def load_toml(file_names: Union[List[Path], List[str]]) -> MutableMapping[str, A
         return tomli.load(f)
 
 
-def get_config(
-    class_name: Type[FidesConfig] = FidesConfig,
-    *,
-    file_names: Union[List[Path], List[str]] = [
-        "fidesops.toml",
-        "fidesctl.toml",
-        "fides.toml",
-    ],
-) -> FidesConfig:
+DEFAULT_CONFIG_FILE_NAMES = [
+    "fidesops.toml",
+    "fidesctl.toml",
+    "fides.toml",
+]
+
+
+class ConfigSnapshot(NamedTuple):
+    """A loaded config, along with the file and modification time it was read from.
+
+    `path` and `mtime` are `None` when the config was built from the environment.
     """
-    Attempt to read config file named fidesops.toml, fidesctl.toml, or fides.toml from:
-    - env var FIDES__CONFIG_PATH
-    - local directory
-    - parent directory
-    - home directory
-    This will fail on the first encountered bad conf file.
+
+    config: FidesConfig
+    path: Optional[str]
+    mtime: Optional[float]
+
+
+ConfigCacheKey = Tuple[Any, ...]
+
+_config_cache: Dict[ConfigCacheKey, ConfigSnapshot] = {}
+
+
+def _get_config_cache_key(
+    class_name: Type[FidesConfig], file_names: Union[List[Path], List[str]]
+) -> ConfigCacheKey:
+    """Build the key a config snapshot is cached under.
+
+    Only values that can be read without touching the filesystem are included
+    so that a cache hit stays cheap. Any change to a `FIDES*` or `TESTING`
+    environment variable, or to the working directory, results in a new key.
     """
+    # Only the values of matching names are read, as each read decodes the value
+    env = tuple(
+        sorted(
+            (key, os.environ[key])
+            for key in os.environ
+            if key[:5].upper() == "FIDES" or key.upper() == "TESTING"
+        )
+    )
+    return (
+        class_name,
+        tuple(str(file_name) for file_name in file_names),
+        os.getcwd(),
+        env,
+    )
+
+
+def _load_config_snapshot(
+    class_name: Type[FidesConfig], file_names: Union[List[Path], List[str]]
+) -> ConfigSnapshot:
+    """Read and validate the config, from a file if one is found, otherwise from
+    environment variables.
+    """
+    filenames_as_str = " or ".join([str(x) for x in file_names])
     try:
-        filenames_as_str = " or ".join([str(x) for x in file_names])
         logger.info(
             "Attempting to load application config from files: %s", filenames_as_str
         )
-        return class_name.parse_obj(load_toml(file_names))
-    except (FileNotFoundError) as e:
+        file_name = load_file(file_names)
+        mtime = os.path.getmtime(file_name)
+        with open(file_name, "rb") as f:
+            return ConfigSnapshot(
+                config=class_name.parse_obj(tomli.load(f)),
+                path=os.path.abspath(file_name),
+                mtime=mtime,
+            )
+    except FileNotFoundError as e:
         logger.warning(
             "Application config could not be loaded from files: %s due to error: %s",
             filenames_as_str,
@@ -269,7 +472,7 @@ def get_config(
             logger.info(
                 "Attempting to load application config from environment variables"
             )
-            return class_name()
+            return ConfigSnapshot(config=class_name(), path=None, mtime=None)
         except ValidationError as exc:
             logger.error(
                 "Application config could not be loaded from environment variables due to error: %s",
@@ -279,3 +482,64 @@ def get_config(
             # an ImportError. This means the config has not been correctly specified
             # so we can throw the missing config error.
             raise MissingConfig(exc.args[0]) from exc
+
+
+def get_config(  # pylint: disable=dangerous-default-value
+    class_name: Type[FidesConfig] = FidesConfig,
+    *,
+    file_names: Union[List[Path], List[str]] = DEFAULT_CONFIG_FILE_NAMES,
+) -> FidesConfig:
+    """
+    Attempt to read config file named fidesops.toml, fidesctl.toml, or fides.toml from:
+    - env var FIDES__CONFIG_PATH
+    - local directory
+    - parent directory
+    - home directory
+    This will fail on the first encountered bad conf file.
+
+    The loaded config is cached for the life of the process, keyed on the config
+    class, the file names, the working directory and any `FIDES*` environment
+    variables. Once cached, calls return it without touching the filesystem.
+    As the config is shared between callers it can't be changed, use
+    `copy(update=...)` to build a changed one. Use `reload_config` to pick up
+    changes made to the config file, or `invalidate_config` to discard all
+    cached configs.
+    """
+    key = _get_config_cache_key(class_name, file_names)
+    snapshot = _config_cache.get(key)
+    if snapshot is None:
+        snapshot = _load_config_snapshot(class_name, file_names)
+        _config_cache[key] = snapshot
+    return snapshot.config
+
+
+def reload_config(  # pylint: disable=dangerous-default-value
+    class_name: Type[FidesConfig] = FidesConfig,
+    *,
+    file_names: Union[List[Path], List[str]] = DEFAULT_CONFIG_FILE_NAMES,
+) -> FidesConfig:
+    """Re-resolve the config file and reload the config if it has changed.
+
+    The cached config is kept if it was read from the same file, with the same
+    modification time, as the one that would be loaded now. As with `get_config`,
+    the config returned is shared and can't be changed.
+    """
+    key = _get_config_cache_key(class_name, file_names)
+    snapshot = _config_cache.get(key)
+    if snapshot is not None:
+        try:
+            file_name: Optional[str] = os.path.abspath(load_file(file_names))
+        except FileNotFoundError:
+            file_name = None
+        mtime = os.path.getmtime(file_name) if file_name else None
+        if (snapshot.path, snapshot.mtime) == (file_name, mtime):
+            return snapshot.config
+
+    snapshot = _load_config_snapshot(class_name, file_names)
+    _config_cache[key] = snapshot
+    return snapshot.config
+
+
+def invalidate_config() -> None:
+    """Discard all cached configs, the next `get_config` call will reload."""
+    _config_cache.clear()
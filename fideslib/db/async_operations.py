@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from typing import Any, Sequence, Type, TypeVar
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fideslib.db.model_mixin import ModelMixin
+from fideslib.db.session import in_unit_of_work
+from fideslib.db.util import (
+    async_commit_or_flush,
+    async_raise_stale_object_error,
+    get_column_values,
+    get_key_from_data,
+    set_committed_column_values,
+)
+
+T = TypeVar("T", bound="AsyncOperationsMixin")
+
+
+class AsyncOperationsMixin(ModelMixin):
+    """The asyncio counterparts of OrmWrappedFidesBase's get, get_by, all, create,
+    update, save, delete and persist_obj, prefixed with `async_`, which take an
+    AsyncSession.
+
+    Deferred columns can't be loaded when first accessed with an AsyncSession, so
+    the getters take the same `only`, `defer` and `undefer_group` arguments to
+    load them up front.
+    """
+
+    @classmethod
+    async def async_get(
+        cls: Type[T],
+        db: AsyncSession,
+        *,
+        object_id: Any,
+        only: Sequence[str] | None = None,
+        defer: Sequence[str] | None = None,
+        undefer_group: str | None = None,
+    ) -> T | None:
+        """Fetch a database record via a table ID."""
+        options = cls._loader_options(
+            only=only, defer=defer, undefer_group=undefer_group
+        )
+        if not options:
+            return await db.get(cls, object_id)
+
+        # Unlike a select, a get that finds the object already loaded doesn't load
+        # the deferred columns asked for
+        result = await db.execute(
+            select(cls).filter_by(id=object_id).options(*options)  # type: ignore
+        )
+        return result.scalars().first()
+
+    @classmethod
+    async def async_get_by(
+        cls: Type[T],
+        db: AsyncSession,
+        *,
+        field: str,
+        value: str | int,
+        only: Sequence[str] | None = None,
+        defer: Sequence[str] | None = None,
+        undefer_group: str | None = None,
+    ) -> T | None:
+        """Fetch a database record via a dynamic key, supplied at call time."""
+        kwargs = {field: value}
+        result = await db.execute(
+            select(cls)  # type: ignore
+            .filter_by(**kwargs)
+            .options(
+                *cls._loader_options(
+                    only=only, defer=defer, undefer_group=undefer_group
+                )
+            )
+            .limit(1)
+        )
+        return result.scalars().first()
+
+    @classmethod
+    async def async_all(
+        cls: Type[T],
+        db: AsyncSession,
+        *,
+        only: Sequence[str] | None = None,
+        defer: Sequence[str] | None = None,
+        undefer_group: str | None = None,
+    ) -> list[T]:
+        """Fetch all database records in table."""
+        result = await db.execute(
+            select(cls).options(  # type: ignore
+                *cls._loader_options(
+                    only=only, defer=defer, undefer_group=undefer_group
+                )
+            )
+        )
+        return result.scalars().all()
+
+    @classmethod
+    async def async_create(
+        cls: Type[T], db: AsyncSession, *, data: dict[str, Any]
+    ) -> T:
+        """Create a new row in the database."""
+        # Build properly formatted key and name for applicable classes, and check
+        # neither is taken with a single query
+        statement = cls._key_or_name_collisions_statement([data])
+        if statement is not None:
+            cls._raise_key_or_name_collision(await db.execute(statement), [data])
+
+        # Create
+        db_obj = cls(**data)
+        return await cls.async_persist_obj(db, db_obj)
+
+    async def async_update(self: T, db: AsyncSession, *, data: dict[str, Any]) -> T:
+        """Update specific row with supplied values."""
+        # Set self.key where applicable
+        if hasattr(self, "key") and "key" in data:
+            data["key"] = get_key_from_data(data, self.__class__.__name__)
+
+        # Update dataset with values in data
+        for key, val in data.items():
+            setattr(self, key, val)
+
+        return await self.async_save(db=db)
+
+    async def async_delete(self: T, db: AsyncSession) -> T | None:
+        """Delete an existing row in the database from an existing object in memory."""
+        async with async_raise_stale_object_error(db, self):
+            await db.delete(self)
+            await async_commit_or_flush(db)
+        self._invalidate_cached_record(db)
+        return self
+
+    async def async_save(self: T, db: AsyncSession) -> T:
+        """Save the current object over an existing row in the database."""
+        self.validate_key()
+        saved = await AsyncOperationsMixin.async_persist_obj(db, self)
+        self._invalidate_cached_record(db)
+        return saved
+
+    @classmethod
+    async def async_persist_obj(cls, db: AsyncSession, resource: T) -> T:
+        """Method to be run after 'async_create' or 'async_save' to write the
+        resource to the db. Within an `async_unit_of_work` the resource is only
+        flushed.
+        """
+        db.add(resource)
+        async with async_raise_stale_object_error(db, resource):
+            if in_unit_of_work(db):
+                await db.flush()
+                if resource.refresh_after_persist:
+                    await db.refresh(resource)
+                return resource
+
+            if resource.refresh_after_persist:
+                await db.commit()
+                await db.refresh(resource)
+                return resource
+
+            inserting = not inspect(resource).has_identity
+            await db.flush()
+            values = get_column_values(resource, inserting)
+            await db.commit()
+        set_committed_column_values(resource, values)
+        return resource
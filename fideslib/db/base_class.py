@@ -3,43 +3,105 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Type, TypeVar
-from uuid import uuid4
-
-from fideslang.models import FidesKey  # type: ignore
-from sqlalchemy import Column, DateTime, String
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, NamedTuple, Sequence, Type, TypeVar
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    FetchedValue,
+    Integer,
+    String,
+    TypeDecorator,
+    inspect,
+    or_,
+    select,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Row  # type: ignore
 from sqlalchemy.ext.declarative import declarative_base, declared_attr
 from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import defer as defer_column
+from sqlalchemy.orm import load_only, make_transient_to_detached
+from sqlalchemy.orm import undefer_group as undefer_group_option
+from sqlalchemy.orm.attributes import InstrumentedAttribute, set_committed_value
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy.sql import func
-from sqlalchemy.sql.expression import BinaryExpression, BooleanClauseList
-
+from sqlalchemy.sql.expression import BinaryExpression, BooleanClauseList, Select
+
+from fideslib.db.async_operations import AsyncOperationsMixin
+from fideslib.db.bulk import BulkOperationsMixin
+from fideslib.db.cache import SecondLevelCacheMixin
+from fideslib.db.pagination import PaginationMixin
+from fideslib.db.rows import RowModeMixin
+from fideslib.db.session import in_unit_of_work, use_primary
+from fideslib.db.util import (
+    commit_or_flush,
+    get_column_values,
+    get_key_from_data,
+    raise_stale_object_error,
+    set_committed_column_values,
+)
 from fideslib.exceptions import KeyOrNameAlreadyExists, KeyValidationError
-from fideslib.utils.text import to_snake_case
+from fideslib.utils.ids import generate_id
 
 T = TypeVar("T", bound="OrmWrappedFidesBase")
 ALLOWED_CHARS = re.compile(r"[A-z0-9\-_]")
 
 
-def get_key_from_data(data: dict[str, Any], cls_name: str) -> str:
-    """Extracts key from data, validates.
+class ModelMetadata(NamedTuple):
+    """Details of a model's columns, computed once per model by
+    `OrmWrappedFidesBase.get_model_metadata`.
+    """
+
+    field_names: tuple[str, ...]
+    optional_field_names: tuple[str, ...]
+    column_types: Mapping[str, Any]
+    has_key: bool
+    has_name: bool
 
-    If no key, uses a snake-cased name. Will be used as the URL onupdate
-    applicable classes.
+
+class PrefixedUUID(TypeDecorator):  # pylint: disable=too-many-ancestors
+    """An ID of the form `<prefix>_<uuid>`, as created by `generate_id`, stored as a
+    native 16 byte UUID. Only the UUID is stored, the prefix is added back when
+    the ID is loaded.
     """
-    key = FidesKey.validate(data.get("key")) if data.get("key") else None
-    if key is None:
-        name = data.get("name")
-        if name is None:
-            raise KeyValidationError(f"{cls_name} requires a name.")
-        key = FidesKey.validate(to_snake_case(name))
-    return key
+
+    impl = postgresql.UUID
+    cache_ok = True
+
+    def __init__(self, prefix: str) -> None:
+        super().__init__(as_uuid=False)
+        self.prefix = prefix
+
+    @property
+    def python_type(self) -> type:
+        return str
+
+    def process_bind_param(self, value: Any, dialect: Any) -> str | None:
+        if value is None:
+            return None
+        prefix, _, uuid = str(value).rpartition("_")
+        if prefix not in ("", self.prefix):
+            raise ValueError(f"ID {value} must have the prefix {self.prefix}_.")
+        return uuid
+
+    def process_result_value(self, value: Any, dialect: Any) -> str | None:
+        if value is None:
+            return None
+        return f"{self.prefix}_{value}"
+
+    def process_literal_param(self, value: Any, dialect: Any) -> str | None:
+        # The UUID type quotes the value when rendering it inline
+        return self.process_bind_param(value, dialect)
 
 
 class FidesBase:
     """
     A generic base class to be used for all DB models, automatically adding the
     following fields to every table:
-    - id: a UUID
+    - id: a UUID, time-ordered unless set otherwise with `set_id_strategy`
     - created_at: the datetime that the record was created
     - updated_at: the datetime that the record was last updated
     """
@@ -52,13 +114,12 @@ class FidesBase:
         try:
             # `self` in this context is an instance of
             # sqlalchemy.dialects.postgresql.psycopg2.PGExecutionContext_psycopg2
-            prefix = f"{self.current_column.table.name[:3]}_"  # type: ignore
+            table_name = self.current_column.table.name  # type: ignore
         except AttributeError:
             # If the table name is unavailable for any reason, we don't
             # need to use it
-            prefix = ""
-        uuid = str(uuid4())
-        return f"{prefix}{uuid}"
+            table_name = None
+        return generate_id(table_name)
 
     @declared_attr
     def __tablename__(self) -> str:
@@ -76,16 +137,56 @@ class FidesBase:
 
     id = Column(String(255), primary_key=True, index=True, default=generate_uuid)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
-    )
 
+    @declared_attr
+    def updated_at(cls) -> Column:  # pylint: disable=no-self-argument
+        """The datetime that the record was last updated"""
+        # A FetchedValue lets models that aren't refreshed after persisting fetch
+        # the new value with RETURNING on UPDATE
+        server_onupdate = (
+            [] if _refreshes_after_persist(cls) else [FetchedValue(for_update=True)]
+        )
+        return Column(
+            DateTime(timezone=True),
+            *server_onupdate,
+            server_default=func.now(),
+            onupdate=func.now(),
+        )
+
+
+class CompactIdMixin:
+    """Stores a model's ID as a native UUID, rather than as text, and without the
+    extra index on it that FidesBase adds alongside the primary key.
+
+    IDs keep their `<prefix>_<uuid>` form in Python. Columns with a foreign key
+    to the ID should be declared with the same PrefixedUUID type. Include it
+    before Base, e.g. `class MyModel(CompactIdMixin, Base)`.
+    """
 
-class OrmWrappedFidesBase(FidesBase):
+    @declared_attr
+    def id(cls) -> Column:  # pylint: disable=no-self-argument
+        """The ID column, a PrefixedUUID using the table name's prefix"""
+        return Column(
+            PrefixedUUID(cls.__tablename__[:3]),  # type: ignore # pylint: disable=E1101
+            primary_key=True,
+            default=FidesBase.generate_uuid,
+        )
+
+
+class OrmWrappedFidesBase(
+    BulkOperationsMixin,
+    PaginationMixin,
+    RowModeMixin,
+    AsyncOperationsMixin,
+    SecondLevelCacheMixin,
+    FidesBase,
+):
     """A wrapper class for our base model.
 
     This allows us to include the base model in type checking for our return types.
     This abstraction includes the following methods:
+    - get_model_metadata(): return the model's field names, optional field names,
+        column types, and whether it has a key and a name, computed once
     - get(id): return the record at that particular ID
     - all(): return all records in that table
     - filter(conditions): return all records that satisfy filter conditions
@@ -98,28 +199,61 @@ class OrmWrappedFidesBase(FidesBase):
     - delete_all: delete all records in this table
     - save: update the record related to the object calling this method with the current
         data stored on the object
+
+    The methods for many records at once, pagination and counting, row mode reads,
+    and the asyncio counterparts of these methods come from BulkOperationsMixin,
+    PaginationMixin, RowModeMixin and AsyncOperationsMixin, and second-level
+    caching from SecondLevelCacheMixin.
+
+    get, get_by, query, all and filter take `only` and `defer` lists of column names,
+    to load only the given columns, or all but the given columns, up front, and an
+    `undefer_group` naming a group of deferred columns to load up front too. Any
+    other column is loaded when it's first accessed.
     """
 
-    __mapper_args__ = {"confirm_deleted_rows": False}
-    # This line hides sql alchemy warnings of the form:
-    # Sqlalchemy/orm/persistence.py:1461: SAWarning: DELETE statement on table
-    # 'storageconfig' expected to delete 1 row(s); 0 were matched. Please set
-    # confirm_deleted_rows=False within the mapper configuration to prevent this
-    # warning.
+    @declared_attr
+    def __mapper_args__(cls) -> dict[str, Any]:  # pylint: disable=no-self-argument
+        """The mapper arguments of each model, see `_get_mapper_args`"""
+        return _get_mapper_args(cls)
+
+    # When False, persist_obj keeps the values written and returned by the flush
+    # instead of reloading the row after committing. Only disable this on models
+    # whose columns aren't changed by database triggers. Server generated values
+    # are then fetched with RETURNING, which stops SQLAlchemy from batching
+    # UPDATEs of many objects of the model into one statement.
+    refresh_after_persist = True
+
+    @classmethod
+    def get_model_metadata(cls) -> ModelMetadata:
+        """Returns the details of the wrapped model's columns, which are computed on
+        first use and then reused.
+        """
+        return _get_model_metadata(cls)  # type: ignore
 
     @classmethod
     def get_optional_field_names(cls) -> list[str]:
         """Returns the names of all nullable fields on the wrapped model."""
-        return [
-            field.name
-            for field in list(cls.__table__.columns)  # type: ignore # pylint: disable=E1101
-            if field.nullable
-        ]
+        return list(cls.get_model_metadata().optional_field_names)
 
     @classmethod
-    def get(cls: Type[T], db: Session, *, object_id: Any) -> T | None:
+    def get(
+        cls: Type[T],
+        db: Session,
+        *,
+        object_id: Any,
+        only: Sequence[str] | None = None,
+        defer: Sequence[str] | None = None,
+        undefer_group: str | None = None,
+    ) -> T | None:
         """Fetch a database record via a table ID."""
-        return db.query(cls).get(object_id)
+        query = cls.query(db, only=only, defer=defer, undefer_group=undefer_group)
+        if cls.second_level_cache is None:
+            return query.get(object_id)
+
+        obj = cls._get_loaded(db, object_id)
+        if obj is not None:
+            return obj
+        return cls._get_cached(db, ("id", object_id), lambda: query.get(object_id))
 
     @classmethod
     def get_by(
@@ -128,51 +262,258 @@ class OrmWrappedFidesBase(FidesBase):
         *,
         field: str,
         value: str | int,
+        only: Sequence[str] | None = None,
+        defer: Sequence[str] | None = None,
+        undefer_group: str | None = None,
     ) -> T | None:
         """Fetch a database record via a dynamic key, supplied at call time."""
         kwargs = {field: value}
-        return db.query(cls).filter_by(**kwargs).first()
+        query = cls.query(
+            db, only=only, defer=defer, undefer_group=undefer_group
+        ).filter_by(**kwargs)
+        if cls.second_level_cache is None:
+            return query.first()
+
+        return cls._get_cached(db, ("by", field, value), query.first)
 
     @classmethod
-    def query(cls: Type[T], db: Session) -> Query:
+    def _get_loaded(cls: Type[T], db: Session, object_id: Any) -> T | None:
+        """Return the object for an ID if the session has it loaded and unexpired."""
+        obj = db.identity_map.get(identity_key(cls, object_id))
+        if obj is None:
+            return None
+
+        column_keys = {
+            prop.key
+            for prop in cls.__mapper__.column_attrs  # type: ignore
+            if not prop.deferred
+        }
+        if inspect(obj).expired_attributes & column_keys:
+            return None
+        return obj
+
+    @classmethod
+    def query(
+        cls: Type[T],
+        db: Session,
+        *,
+        only: Sequence[str] | None = None,
+        defer: Sequence[str] | None = None,
+        undefer_group: str | None = None,
+    ) -> Query:
         """Create a blank query for the class."""
-        return db.query(cls)
+        return db.query(cls).options(
+            *cls._loader_options(only=only, defer=defer, undefer_group=undefer_group)
+        )
+
+    @classmethod
+    def _loader_options(
+        cls,
+        *,
+        only: Sequence[str] | None = None,
+        defer: Sequence[str] | None = None,
+        undefer_group: str | None = None,
+    ) -> list[Any]:
+        """Return the loader options for the `only`, `defer` and `undefer_group`
+        arguments of the getters.
+        """
+        options: list[Any] = []
+        if only is not None:
+            options.append(load_only(*cls._get_column_attributes(only)))
+        if defer is not None:
+            options.extend(
+                defer_column(attr) for attr in cls._get_column_attributes(defer)
+            )
+        if undefer_group is not None:
+            options.append(undefer_group_option(undefer_group))
+        return options
+
+    @classmethod
+    def _get_column_attributes(
+        cls, names: Sequence[str]
+    ) -> list[InstrumentedAttribute]:
+        """Return the attributes for the given column names, raising a ValueError
+        for any that aren't columns of this class.
+        """
+        column_keys = cls.__mapper__.column_attrs.keys()  # type: ignore
+        for name in names:
+            if name not in column_keys:
+                raise ValueError(f"{name} is not a column of {cls.__name__}.")
+        return [getattr(cls, name) for name in names]
 
     @classmethod
-    def all(cls: Type[T], db: Session) -> list[T]:
+    def all(
+        cls: Type[T],
+        db: Session,
+        *,
+        only: Sequence[str] | None = None,
+        defer: Sequence[str] | None = None,
+        undefer_group: str | None = None,
+    ) -> list[T]:
         """Fetch all database records in table."""
-        return db.query(cls).all()
+        return cls.query(db, only=only, defer=defer, undefer_group=undefer_group).all()
 
     @classmethod
     def filter(
-        cls: Type[T], db: Session, *, conditions: BinaryExpression | BooleanClauseList
+        cls: Type[T],
+        db: Session,
+        *,
+        conditions: BinaryExpression | BooleanClauseList,
+        only: Sequence[str] | None = None,
+        defer: Sequence[str] | None = None,
+        undefer_group: str | None = None,
     ) -> Query:
         """Fetch multiple models from a database table."""
-        return db.query(cls).filter(conditions)
+        return cls.query(
+            db, only=only, defer=defer, undefer_group=undefer_group
+        ).filter(conditions)
 
     @classmethod
     def create(cls: Type[T], db: Session, *, data: dict[str, Any]) -> T:
         """Create a new row in the database."""
-        # Build properly formatted key for applicable classes
-        if hasattr(cls, "key"):
-            data["key"] = get_key_from_data(data, cls.__name__)
-            if db.query(cls).filter_by(key=data["key"]).first():
+        # Build properly formatted key and name for applicable classes, and check
+        # neither is taken with a single query
+        cls._check_bulk_key_or_name_collisions(db, [data])
+
+        # Create
+        db_obj = cls(**data)
+        return cls.persist_obj(db, db_obj)
+
+    @classmethod
+    def _check_bulk_key_or_name_collisions(
+        cls, db: Session, rows: list[dict[str, Any]]
+    ) -> None:
+        """Normalize the key and name of each row, raising KeyOrNameAlreadyExists
+        if any are repeated within rows or already exist in the table.
+
+        The check is read from the primary, as it guards a write.
+        """
+        statement = cls._key_or_name_collisions_statement(rows)
+        if statement is not None:
+            with use_primary(db):
+                existing_rows = db.execute(statement).all()
+            cls._raise_key_or_name_collision(existing_rows, rows)
+
+    @classmethod
+    def _key_or_name_collisions_statement(
+        cls, rows: list[dict[str, Any]]
+    ) -> Select | None:
+        """Normalize the key and name of each row, raising KeyOrNameAlreadyExists
+        if any are repeated within rows, and return a select of the keys and names
+        of any existing records that share them, if the class has either.
+        """
+        metadata = cls.get_model_metadata()
+        has_key, has_name = metadata.has_key, metadata.has_name
+        if not (has_key or has_name):
+            return None
+
+        keys, names = cls._normalize_keys_and_names(rows, has_key, has_name)
+        table_columns = cls.__table__.c
+        conditions = []
+        if keys:
+            conditions.append(table_columns["key"].in_(keys))
+        if names - {None}:
+            conditions.append(table_columns["name"].in_(names - {None}))
+        if None in names:
+            conditions.append(table_columns["name"].is_(None))
+        if not conditions:
+            return None
+
+        columns: list[Any] = [
+            table_columns[field]
+            for field, present in (("key", has_key), ("name", has_name))
+            if present
+        ]
+        return select(*columns).where(or_(*conditions)).limit(1)
+
+    @classmethod
+    def _normalize_keys_and_names(
+        cls, rows: list[dict[str, Any]], has_key: bool, has_name: bool
+    ) -> tuple[set[str], set[str | None]]:
+        """Normalize the key and name of each row, where the class has them, and
+        return the keys and names, raising KeyOrNameAlreadyExists if any are
+        repeated within rows.
+        """
+        keys: set[str] = set()
+        names: set[str | None] = set()
+        for row in rows:
+            if has_key:
+                row["key"] = get_key_from_data(row, cls.__name__)
+                if row["key"] in keys:
+                    raise KeyOrNameAlreadyExists(
+                        f"Key {row['key']} is repeated in the rows to create in {cls.__name__}."
+                    )
+                keys.add(row["key"])
+            if has_name:
+                row["name"] = row.get("name")
+                if row["name"] in names:
+                    raise KeyOrNameAlreadyExists(
+                        f"Name {row['name']} is repeated in the rows to create in {cls.__name__}."
+                    )
+                names.add(row["name"])
+        return keys, names
+
+    @classmethod
+    def _raise_key_or_name_collision(
+        cls, existing_rows: Iterable[Row], rows: list[dict[str, Any]]
+    ) -> None:
+        """Raise KeyOrNameAlreadyExists for the first of the existing rows selected
+        by `_key_or_name_collisions_statement`, reporting which field collided.
+        """
+        for existing in existing_rows:
+            existing_values = existing._mapping  # pylint: disable=protected-access
+            if "key" in existing_values and any(
+                row["key"] == existing_values["key"] for row in rows
+            ):
                 raise KeyOrNameAlreadyExists(
-                    f"Key {data['key']} already exists in {cls.__name__}. Keys will be snake-cased names if not provided. "
+                    f"Key {existing_values['key']} already exists in {cls.__name__}. Keys will be snake-cased names if not provided. "
                     f"If you are seeing this error without providing a key, please provide a key or a different name."
-                    ""
                 )
+            raise KeyOrNameAlreadyExists(
+                f"Name {existing_values['name']} already exists in {cls.__name__}."
+            )
 
-        if hasattr(cls, "name"):
-            data["name"] = data.get("name")
-            if db.query(cls).filter_by(name=data["name"]).first():
-                raise KeyOrNameAlreadyExists(
-                    f"Name {data['name']} already exists in {cls.__name__}."
-                )
+    @classmethod
+    def _load_returned_rows(cls: Type[T], db: Session, rows: list[Row]) -> list[T]:
+        """Build persistent objects from full rows returned by a write statement.
 
-        # Create
-        db_obj = cls(**data)  # type: ignore
-        return cls.persist_obj(db, db_obj)
+        The objects are added to the session as though they had just been
+        loaded, so using them doesn't need another SELECT. Objects already in
+        the session are updated with the returned values instead.
+        """
+        columns = list(cls.__table__.columns)
+        return cls._load_column_values(
+            db,
+            [
+                {
+                    column.key: row._mapping[column]  # pylint: disable=protected-access
+                    for column in columns
+                }
+                for row in rows
+            ],
+        )
+
+    @classmethod
+    def _load_column_values(
+        cls: Type[T], db: Session, rows: list[dict[str, Any]]
+    ) -> list[T]:
+        """Build persistent objects from the column values of full rows, as
+        `_load_returned_rows` does.
+        """
+        objs = []
+        for values in rows:
+            existing = db.identity_map.get(identity_key(cls, values["id"]))
+            if existing is not None:
+                for key, value in values.items():
+                    set_committed_value(existing, key, value)
+                objs.append(existing)
+                continue
+
+            obj = cls(**values)
+            make_transient_to_detached(obj)
+            db.add(obj)
+            objs.append(obj)
+        return objs
 
     @classmethod
     def get_by_key_or_id(
@@ -196,7 +537,8 @@ class OrmWrappedFidesBase(FidesBase):
         error will be thrown. If neither `key`, nor `id` are passed in, leave
         `db_obj` as None and assume we are creating a new object.
         """
-        db_obj = cls.get_by_key_or_id(db=db, data=data)
+        with use_primary(db):
+            db_obj = cls.get_by_key_or_id(db=db, data=data)
         if db_obj:
             db_obj.update(db=db, data=data)  # type: ignore
         else:
@@ -208,7 +550,8 @@ class OrmWrappedFidesBase(FidesBase):
         cls: Type[T], db: Session, *, data: dict[str, Any]
     ) -> tuple[bool, T | None]:
         """Fetch an object, or create it if none is found."""
-        db_obj = db.query(cls).filter_by(**data).first()
+        with use_primary(db):
+            db_obj = db.query(cls).filter_by(**data).first()
         created = False
         if not db_obj:
             db_obj = cls.create(db=db, data=data)  # type: ignore
@@ -220,7 +563,26 @@ class OrmWrappedFidesBase(FidesBase):
         cls: Type[T], db: Session, *, conditions: Any, values: dict[str, Any]
     ) -> int:
         """Update all objects within a filter at database level."""
-        return db.query(cls).filter(conditions).update(values=values)
+        updated_count = (
+            db.query(cls)
+            .filter(conditions)
+            .update(values=cls._with_version_increment(values))
+        )
+        cls._invalidate_cache(db)
+        return updated_count
+
+    @classmethod
+    def _with_version_increment(cls, values: dict[str, Any]) -> dict[str, Any]:
+        """Add an increment of the version counter, for models that have one, to the
+        values of a bulk update, unless the values already set it.
+        """
+        mapper = cls.__mapper__
+        if mapper.version_id_col is None:
+            return values
+        version = mapper.get_property_by_column(mapper.version_id_col)
+        if version.key in values:
+            return values
+        return {**values, version.key: version.class_attribute + 1}
 
     @classmethod
     def delete_with_class(cls: Type[T], db: Session, *, id: str) -> T | None:
@@ -228,14 +590,17 @@ class OrmWrappedFidesBase(FidesBase):
         obj = db.query(cls).get(id)
         if obj is None:
             return None
-        db.delete(obj)
-        db.commit()
+        with raise_stale_object_error(db, obj):
+            db.delete(obj)
+            commit_or_flush(db)
+        cls._invalidate_cache(db, object_ids=[id])
         return obj
 
     @classmethod
     def delete_all(cls: Type[T], db: Session) -> int:
         """Delete all rows in this table."""
         deleted_count = db.query(cls).delete()
+        cls._invalidate_cache(db)
         return deleted_count
 
     def refresh_from_db(self, db: Session) -> FidesBase | None:
@@ -256,12 +621,14 @@ class OrmWrappedFidesBase(FidesBase):
 
     def delete(self, db: Session) -> FidesBase | None:
         """Delete an existing row in the database from an existing object in memory."""
-        db.delete(self)
-        db.commit()
+        with raise_stale_object_error(db, self):
+            db.delete(self)
+            commit_or_flush(db)
+        self._invalidate_cached_record(db)
         return self
 
-    def save(self, db: Session) -> FidesBase:
-        """Save the current object over an existing row in the database."""
+    def validate_key(self) -> None:
+        """Raise a KeyValidationError if this object has an invalid key."""
         if hasattr(self, "key"):
             key = getattr(self, "key")
 
@@ -274,18 +641,94 @@ class OrmWrappedFidesBase(FidesBase):
                     f"Key '{key}' on {self.__class__.__name__} is invalid."
                 )
 
-        return OrmWrappedFidesBase.persist_obj(db, self)
+    def save(self, db: Session) -> FidesBase:
+        """Save the current object over an existing row in the database."""
+        self.validate_key()
+        saved = OrmWrappedFidesBase.persist_obj(db, self)
+        self._invalidate_cached_record(db)
+        return saved
 
     @classmethod
     def persist_obj(cls: Type[T], db: Session, resource: T) -> T:
         """Method to be run after 'create' or 'save' to write the resource to the db
         Can be overridden on subclasses to not commit immediately when creating
-        creating/updating.
+        creating/updating. Within a `unit_of_work` the resource is only flushed.
         """
         db.add(resource)
-        db.commit()
-        db.refresh(resource)
+        with raise_stale_object_error(db, resource):
+            if in_unit_of_work(db):
+                db.flush()
+                if resource.refresh_after_persist:
+                    db.refresh(resource)
+                return resource
+
+            if resource.refresh_after_persist:
+                db.commit()
+                db.refresh(resource)
+                return resource
+
+            inserting = not inspect(resource).has_identity
+            db.flush()
+            values = get_column_values(resource, inserting)
+            db.commit()
+        set_committed_column_values(resource, values)
         return resource
 
 
+def _refreshes_after_persist(model: Any) -> bool:
+    return getattr(model, "refresh_after_persist", True)
+
+
+def _get_mapper_args(model: Any) -> dict[str, Any]:
+    return {
+        # confirm_deleted_rows hides sql alchemy warnings of the form:
+        # Sqlalchemy/orm/persistence.py:1461: SAWarning: DELETE statement on table
+        # 'storageconfig' expected to delete 1 row(s); 0 were matched. Please set
+        # confirm_deleted_rows=False within the mapper configuration to prevent
+        # this warning.
+        "confirm_deleted_rows": False,
+        # eager_defaults fetches server generated values, such as created_at, with
+        # RETURNING as part of each INSERT or UPDATE, for models that keep the
+        # values from the flush rather than being refreshed.
+        "eager_defaults": not _refreshes_after_persist(model),
+    }
+
+
+@lru_cache(maxsize=None)
+def _get_model_metadata(model: Type[OrmWrappedFidesBase]) -> ModelMetadata:
+    columns = list(model.__table__.columns)
+    return ModelMetadata(
+        field_names=tuple(column.name for column in columns),
+        optional_field_names=tuple(
+            column.name for column in columns if column.nullable
+        ),
+        column_types=MappingProxyType({column.name: column.type for column in columns}),
+        has_key="key" in model.__table__.columns,
+        has_name="name" in model.__table__.columns,
+    )
+
+
+class VersionedMixin:
+    """Adds a version counter to a model, which is checked and incremented by each
+    UPDATE or DELETE of an object, so a write based on an out of date copy of
+    the row raises a StaleObjectError rather than overwriting the newer write.
+
+    Bulk updates made through the class methods increment the version too.
+    Include it before Base, e.g. `class MyModel(VersionedMixin, Base)`.
+    """
+
+    version_id = Column(Integer, nullable=False, server_default="1")
+
+    @declared_attr
+    def __mapper_args__(cls) -> dict[str, Any]:  # pylint: disable=no-self-argument
+        """The mapper arguments of OrmWrappedFidesBase, with the version counter"""
+        return {
+            **_get_mapper_args(cls),
+            # Needed for a DELETE to check the version, and raises rather than
+            # warns on a mismatch where there's a version counter
+            "confirm_deleted_rows": True,
+            "version_id_col": cls.version_id,
+        }
+
+
 Base = declarative_base(cls=OrmWrappedFidesBase)
@@ -0,0 +1,551 @@
+from __future__ import annotations
+
+from time import sleep
+from typing import Any, Callable, Iterable, Sequence, Type, TypeVar
+
+from sqlalchemy import (
+    PrimaryKeyConstraint,
+    UniqueConstraint,
+    delete,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Row  # type: ignore
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.sql import func
+
+from fideslib.db.model_mixin import ModelMixin
+from fideslib.db.session import use_primary
+from fideslib.db.util import (
+    BULK_CHUNK_SIZE,
+    commit_or_flush,
+    get_key_from_data,
+    id_in,
+    rollback_unless_in_unit_of_work,
+)
+from fideslib.exceptions import KeyOrNameAlreadyExists
+from fideslib.utils.ids import generate_id
+
+T = TypeVar("T", bound="BulkOperationsMixin")
+
+
+class BulkOperationsMixin(ModelMixin):
+    """Methods of OrmWrappedFidesBase for reading and writing many records with a
+    few statements:
+    - get_many(ids): return the records at the provided IDs, using one query
+    - bulk_create(rows): create many records with one INSERT per chunk of rows
+    - upsert(data) / bulk_upsert(rows): create records, or update them where they
+        already exist, with one INSERT ... ON CONFLICT DO UPDATE per chunk of rows
+    - get_or_create_atomic(data): create a record, or fetch it if it already exists,
+        safely under concurrency
+    - delete_by_ids(ids): delete the records at the provided IDs without loading them
+    - update_with_class_in_chunks / delete_all_in_chunks: as update_with_class and
+        delete_all, committing a chunk of rows at a time, with optional pauses
+    """
+
+    @classmethod
+    def get_many(
+        cls: Type[T],
+        db: Session,
+        *,
+        object_ids: Sequence[Any],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> list[T | None]:
+        """Fetch database records via their table IDs.
+
+        Records already loaded in the session are used as they are, the rest are
+        fetched with one query per `chunk_size` ids. Records are returned in the
+        order of `object_ids`, with None for any that don't exist.
+        """
+        found: dict[Any, T] = {}
+        missing = []
+        for object_id in dict.fromkeys(object_ids):
+            obj = cls._get_loaded(db, object_id)
+            if obj is not None:
+                found[object_id] = obj
+            else:
+                missing.append(object_id)
+
+        for start in range(0, len(missing), chunk_size):
+            chunk = missing[start : start + chunk_size]
+            for obj in db.query(cls).filter(id_in(cls.id, chunk)):
+                found[obj.id] = obj
+
+        return [found.get(object_id) for object_id in object_ids]
+
+    @classmethod
+    def bulk_create(
+        cls: Type[T],
+        db: Session,
+        *,
+        rows: list[dict[str, Any]],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> list[T]:
+        """Create many new rows in the database, returning them in input order.
+
+        Keys and names are normalized and checked for collisions, both within
+        `rows` and against the table, with a single query up front. Rows are
+        then written `chunk_size` at a time using multi-row
+        INSERT ... RETURNING statements, and committed together.
+        """
+        table = cls.__table__
+        # The id default can only see the table for the first row of a
+        # multi-row INSERT, so ids are generated up front instead.
+        rows = [{"id": generate_id(table.name), **row} for row in rows]
+        cls._check_bulk_key_or_name_collisions(db, rows)
+
+        returned_rows = cls._execute_in_chunks(
+            db,
+            rows,
+            chunk_size,
+            lambda values: insert(table).values(values).returning(*table.columns),
+        )
+        return cls._load_returned_rows(db, returned_rows)
+
+    @classmethod
+    def upsert(
+        cls: Type[T],
+        db: Session,
+        *,
+        data: dict[str, Any],
+        conflict_target: str | None = None,
+        update_columns: list[str] | None = None,
+    ) -> T:
+        """Create a row, or update the existing one, in a single statement.
+
+        See `bulk_upsert` for how the conflict target and updated columns are
+        chosen.
+        """
+        return cls.bulk_upsert(
+            db,
+            rows=[data],
+            conflict_target=conflict_target,
+            update_columns=update_columns,
+        )[0]
+
+    @classmethod
+    def bulk_upsert(
+        cls: Type[T],
+        db: Session,
+        *,
+        rows: list[dict[str, Any]],
+        conflict_target: str | None = None,
+        update_columns: list[str] | None = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> list[T]:
+        """Create rows, or update the existing ones, returning them in input order.
+
+        Each chunk of rows is written with one
+        INSERT ... ON CONFLICT (conflict_target) DO UPDATE ... RETURNING
+        statement, so this is safe against concurrent writers, and all chunks are
+        committed together.
+
+        The conflict target defaults to `id` where every row has one, otherwise
+        `key` for classes that have a key. By default all supplied columns other
+        than the conflict target, `id` and `created_at` are updated. Unlike
+        `create_or_update`, `create` and `update` overrides on subclasses are
+        not used.
+        """
+        table = cls.__table__
+        if conflict_target is None:
+            conflict_target = cls._default_upsert_conflict_target(rows)
+        if conflict_target not in table.columns:
+            raise ValueError(
+                f"{conflict_target} is not a column of {cls.__name__}, so can't be used as the conflict target."
+            )
+
+        rows = cls._prepare_upsert_rows(rows, conflict_target)
+        returned_rows = cls._execute_in_chunks(
+            db,
+            rows,
+            chunk_size,
+            lambda values: cls._upsert_statement(
+                values, conflict_target, update_columns
+            ),
+            match_on=conflict_target,
+        )
+        cls._invalidate_cache(db)
+        return cls._load_returned_rows(db, returned_rows)
+
+    @classmethod
+    def _default_upsert_conflict_target(cls, rows: list[dict[str, Any]]) -> str:
+        """Return `key` for classes that have a key where any row has no `id`,
+        otherwise `id`.
+        """
+        if cls.get_model_metadata().has_key and any(
+            row.get("id") is None for row in rows
+        ):
+            return "key"
+        return "id"
+
+    @classmethod
+    def _prepare_upsert_rows(
+        cls, rows: list[dict[str, Any]], conflict_target: str
+    ) -> list[dict[str, Any]]:
+        """Return the rows with an `id` generated where none is supplied and their
+        keys normalized, raising KeyOrNameAlreadyExists if any share a value of
+        the conflict target, as one statement can't update a row twice.
+        """
+        has_key = cls.get_model_metadata().has_key
+        rows = [{"id": generate_id(cls.__table__.name), **row} for row in rows]
+        targets: set[Any] = set()
+        for row in rows:
+            if has_key and (conflict_target == "key" or row.get("key") is not None):
+                row["key"] = get_key_from_data(row, cls.__name__)
+            if row.get(conflict_target) in targets:
+                raise KeyOrNameAlreadyExists(
+                    f"{conflict_target} {row.get(conflict_target)} is repeated in the rows to upsert in {cls.__name__}."
+                )
+            targets.add(row.get(conflict_target))
+        return rows
+
+    @classmethod
+    def _upsert_statement(
+        cls,
+        values: list[dict[str, Any]],
+        conflict_target: str,
+        update_columns: list[str] | None,
+    ) -> Any:
+        """Build the INSERT ... ON CONFLICT DO UPDATE ... RETURNING statement for a
+        chunk of rows, updating `update_columns`, or by default all supplied
+        columns other than the conflict target, `id` and `created_at`.
+        """
+        table = cls.__table__
+        statement = postgresql.insert(table).values(values)
+        columns = update_columns
+        if columns is None:
+            columns = [
+                column
+                for column in values[0]
+                if column not in (conflict_target, "id", "created_at")
+            ]
+        set_ = cls._with_version_increment(
+            {column: statement.excluded[column] for column in columns}
+        )
+        if "updated_at" in table.columns and "updated_at" not in set_:
+            set_["updated_at"] = func.now()
+        return statement.on_conflict_do_update(
+            index_elements=[conflict_target], set_=set_
+        ).returning(*table.columns)
+
+    @classmethod
+    def get_or_create_atomic(
+        cls: Type[T],
+        db: Session,
+        *,
+        data: dict[str, Any],
+        conflict_target: str | Sequence[str] | None = None,
+    ) -> tuple[bool, T]:
+        """Create an object, or fetch the existing one if creating it conflicts.
+
+        The row is written with INSERT ... ON CONFLICT (conflict_target) DO NOTHING
+        RETURNING, so concurrent callers can't both create it, and a SELECT by
+        the conflict target is only needed when the row already existed. The
+        conflict target defaults to the columns of a unique constraint or index
+        of the table that are all supplied in `data`, preferring `id`, then
+        `key`.
+        """
+        table = cls.__table__
+        if cls.get_model_metadata().has_key:
+            data["key"] = get_key_from_data(data, cls.__name__)
+        target = cls._conflict_target_columns(data, conflict_target)
+
+        def build_statement(values: list[dict[str, Any]]) -> Any:
+            statement = postgresql.insert(table).values(values)
+            return statement.on_conflict_do_nothing(index_elements=target).returning(
+                *table.columns
+            )
+
+        # Where the conflicting row is deleted before it can be fetched, the
+        # insert is tried again.
+        while True:
+            row = {"id": generate_id(table.name), **data}
+            returned = cls._execute_in_chunks(db, [row], 1, build_statement)[0]
+            if returned is not None:
+                return True, cls._load_returned_rows(db, [returned])[0]
+
+            existing = (
+                db.query(cls).filter_by(**{column: data[column] for column in target})
+            ).first()
+            if existing is not None:
+                return False, existing
+
+    @classmethod
+    def _conflict_target_columns(
+        cls, data: dict[str, Any], conflict_target: str | Sequence[str] | None
+    ) -> list[str]:
+        """Return the columns of the conflict target, by default those found by
+        `_unique_columns_in`, raising a ValueError if any aren't columns of the
+        table supplied in `data`.
+        """
+        if conflict_target is None:
+            target = cls._unique_columns_in(data)
+        elif isinstance(conflict_target, str):
+            target = [conflict_target]
+        else:
+            target = list(conflict_target)
+        for column in target:
+            if column not in cls.__table__.columns or column not in data:
+                raise ValueError(
+                    f"{column} is not a column of {cls.__name__} supplied in data, so can't be used as the conflict target."
+                )
+        return target
+
+    @classmethod
+    def _unique_columns_in(cls, data: dict[str, Any]) -> list[str]:
+        """Return the columns of a unique constraint or index of the table that are
+        all supplied in `data`, preferring `id`, then `key`.
+
+        Raises a ValueError where there are none, as a conflict couldn't then be
+        told apart from a new row.
+        """
+        candidates = sorted(
+            columns
+            for columns in cls._unique_column_sets()
+            if all(column in data for column in columns)
+        )
+        for preferred in (["id"], ["key"]):
+            if preferred in candidates:
+                return preferred
+        if not candidates:
+            raise ValueError(
+                f"No unique constraint or index of {cls.__name__} has all its columns supplied in data, so a conflict_target must be given."
+            )
+        return candidates[0]
+
+    @classmethod
+    def _unique_column_sets(cls) -> list[list[str]]:
+        """Return the columns of each unique constraint of the table, and of each
+        unique index that isn't partial, as a partial index can't be the target
+        of an ON CONFLICT clause without its predicate.
+        """
+        table = cls.__table__
+        unique_column_sets = [
+            constraint.columns.keys()
+            for constraint in table.constraints
+            if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint))
+        ]
+        unique_column_sets.extend(
+            index.columns.keys()
+            for index in table.indexes
+            if index.unique and not index.dialect_options["postgresql"]["where"]
+        )
+        return unique_column_sets
+
+    @classmethod
+    def _execute_in_chunks(
+        cls,
+        db: Session,
+        rows: list[dict[str, Any]],
+        chunk_size: int,
+        build_statement: Callable[[list[dict[str, Any]]], Any],
+        match_on: str = "id",
+    ) -> list[Row]:
+        """Execute the write statement built for each chunk of rows, then commit,
+        returning the rows the statements return in input order, or None for any
+        row nothing was returned for.
+
+        RETURNING doesn't guarantee the order of the rows it returns, so they're
+        matched to the input rows by the value of their `match_on` column. Any
+        failure rolls back the whole transaction.
+        """
+        returned_rows: list[Row] = []
+        try:
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start : start + chunk_size]
+                # A multi-row VALUES clause needs the same columns in each row,
+                # so rows supplying different columns are written separately.
+                groups: dict[tuple[str, ...], list[int]] = {}
+                for index, row in enumerate(chunk):
+                    groups.setdefault(tuple(sorted(row)), []).append(index)
+
+                returned_by_value = {}
+                for indexes in groups.values():
+                    for returned in db.execute(
+                        build_statement([chunk[index] for index in indexes])
+                    ):
+                        returned_by_value[getattr(returned, match_on)] = returned
+                returned_rows.extend(
+                    returned_by_value.get(row[match_on]) for row in chunk
+                )
+            commit_or_flush(db)
+        except Exception:
+            rollback_unless_in_unit_of_work(db)
+            raise
+        return returned_rows
+
+    @classmethod
+    def delete_by_ids(
+        cls: Type[T],
+        db: Session,
+        *,
+        ids: Iterable[str],
+        return_ids: bool = False,
+    ) -> int | list[str]:
+        """Delete the rows with the given IDs using a single statement, without
+        loading them first, and commit.
+
+        Returns the number of rows deleted, or the IDs of the deleted rows if
+        `return_ids` is set. As the rows aren't loaded, ORM relationship cascades
+        are not applied, any cascades must be enforced by the database.
+        """
+        ids = list(ids)
+        if not ids:
+            return [] if return_ids else 0
+
+        table = cls.__table__
+        statement = delete(table).where(id_in(table.c.id, ids))
+        if return_ids:
+            statement = statement.returning(table.c.id)
+
+        try:
+            result = db.execute(statement)
+            deleted_ids = [row.id for row in result] if return_ids else []
+            deleted_count = len(deleted_ids) if return_ids else result.rowcount
+
+            cls._expunge_loaded(db, ids)
+            commit_or_flush(db)
+        except Exception:
+            rollback_unless_in_unit_of_work(db)
+            raise
+
+        cls._invalidate_cache(db, object_ids=ids)
+        return deleted_ids if return_ids else deleted_count
+
+    @classmethod
+    def _expunge_loaded(cls, db: Session, ids: Iterable[Any]) -> None:
+        """Detach any objects loaded in the session for the rows with the given IDs,
+        which are being deleted without loading them, as they can no longer be
+        loaded, leaving them as they were like `delete` does.
+        """
+        for object_id in ids:
+            obj = db.identity_map.get(identity_key(cls, object_id))
+            if obj is not None:
+                db.expunge(obj)
+
+    @classmethod
+    def update_with_class_in_chunks(
+        cls,
+        db: Session,
+        *,
+        conditions: Any,
+        values: dict[str, Any],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        pause: float = 0,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """Update all objects within a filter at database level, `chunk_size` rows
+        per transaction, returning the number of rows updated.
+
+        See `_process_in_chunks` for how the chunks are run.
+        """
+        table = cls.__table__
+        values = cls._with_version_increment(values)
+
+        def update_chunk(ids: list[Any]) -> int:
+            return db.execute(
+                update(table)
+                .where(id_in(table.c.id, ids))
+                .where(conditions)
+                .values(values)
+            ).rowcount
+
+        return cls._process_in_chunks(
+            db,
+            conditions=conditions,
+            chunk_size=chunk_size,
+            pause=pause,
+            progress=progress,
+            process_chunk=update_chunk,
+        )
+
+    @classmethod
+    def delete_all_in_chunks(
+        cls,
+        db: Session,
+        *,
+        conditions: Any = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        pause: float = 0,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """Delete all rows in this table, or those within a filter, `chunk_size`
+        rows per transaction, returning the number of rows deleted.
+
+        See `_process_in_chunks` for how the chunks are run. As with
+        `delete_by_ids`, ORM relationship cascades are not applied.
+        """
+        table = cls.__table__
+
+        def delete_chunk(ids: list[Any]) -> int:
+            cls._expunge_loaded(db, ids)
+            return db.execute(delete(table).where(id_in(table.c.id, ids))).rowcount
+
+        return cls._process_in_chunks(
+            db,
+            conditions=conditions,
+            chunk_size=chunk_size,
+            pause=pause,
+            progress=progress,
+            process_chunk=delete_chunk,
+        )
+
+    @classmethod
+    def _process_in_chunks(
+        cls,
+        db: Session,
+        *,
+        conditions: Any,
+        chunk_size: int,
+        pause: float,
+        progress: Callable[[int], None] | None,
+        process_chunk: Callable[[list[Any]], int],
+    ) -> int:
+        """Run `process_chunk` on the IDs of the rows within the filter conditions,
+        `chunk_size` IDs at a time in ID order, committing after each chunk.
+
+        Short transactions keep row locks brief on large tables. `pause` seconds
+        are slept between chunks to leave room for other writers, and `progress`
+        is called with the number of rows affected so far after each chunk.
+        Returns the total number of rows affected. If a chunk fails, only that
+        chunk is rolled back. The IDs are read from the primary, where the chunks
+        are processed.
+        """
+        table = cls.__table__
+        total = 0
+        last_id = None
+        while True:
+            statement = (
+                select(table.c.id)  # type: ignore
+                .order_by(table.c.id)
+                .limit(chunk_size)
+            )
+            if conditions is not None:
+                statement = statement.where(conditions)
+            if last_id is not None:
+                statement = statement.where(table.c.id > last_id)
+
+            try:
+                with use_primary(db):
+                    ids = db.execute(statement).scalars().all()
+                if not ids:
+                    commit_or_flush(db)
+                    break
+                total += process_chunk(ids)
+                commit_or_flush(db)
+            except Exception:
+                rollback_unless_in_unit_of_work(db)
+                raise
+
+            cls._invalidate_cache(db)
+            if progress is not None:
+                progress(total)
+            if len(ids) < chunk_size:
+                break
+            last_id = ids[-1]
+            if pause:
+                sleep(pause)
+        return total
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable, Iterable, Tuple
+from uuid import uuid4
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from fideslib.db.model_mixin import ModelMixin
+from fideslib.db.session import use_primary
+
+DEFAULT_CACHE_MAX_SIZE = 1024
+DEFAULT_CACHE_TTL_SECONDS = 60.0
+
+
+class CacheBackend(ABC):
+    """The interface a second-level cache backend must implement.
+
+    Values are dicts of column values, so backends shared between processes
+    will need to serialize them.
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Any | None:
+        """Return the value cached at key, or None if there isn't one."""
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache value at key."""
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        """Remove any value cached at key."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached values."""
+
+
+class LRUCacheBackend(CacheBackend):
+    """An in-process cache, holding at most `max_size` values for at most
+    `ttl` seconds each, evicting the least recently used value first.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_MAX_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._values: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            cached = self._values.get(key)
+            if cached is None:
+                return None
+
+            expires_at, value = cached
+            if expires_at <= monotonic():
+                del self._values[key]
+                return None
+
+            self._values.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._values[key] = (monotonic() + self.ttl, value)
+            self._values.move_to_end(key)
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class ModelCache:
+    """The second-level cache for a single model, set as the model's
+    `second_level_cache` to enable caching of `get` and `get_by`.
+
+    Records are cached under their table name, the table's generation and ID,
+    so the cache can be shared between processes through the backend. A
+    `get_by` lookup is cached as the ID of the record it found, and only served
+    while that record is cached and still matches. Writing a record through the
+    model's instance methods deletes its cached values, while writes to many
+    records at once start a new generation of the table, leaving the values
+    cached in earlier ones to expire. Writes made any other way are only picked
+    up once entries expire, so only cache models whose rows rarely change.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        *,
+        max_size: int = DEFAULT_CACHE_MAX_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.backend = backend or LRUCacheBackend(max_size=max_size, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(table_name: str, *lookup: Any) -> Tuple[Any, ...]:
+        """Return the key to cache a lookup of a record of the table under."""
+        return ("fideslib", table_name, *lookup)
+
+    def get(self, table_name: str, lookup: Tuple[Any, ...]) -> dict[str, Any] | None:
+        """Return the column values cached for a lookup, either ("id", object_id) or
+        ("by", field, value), counting the hit or miss.
+        """
+        generation = self._generation(table_name)
+        if lookup[0] == "by":
+            _, field, value = lookup
+            object_id = self.backend.get(self.key(table_name, generation, *lookup))
+            values = None
+            if object_id is not None:
+                values = self.backend.get(
+                    self.key(table_name, generation, "id", object_id)
+                )
+            if values is not None and values.get(field) != value:
+                values = None
+        else:
+            values = self.backend.get(self.key(table_name, generation, *lookup))
+
+        if values is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return values
+
+    def set(
+        self, table_name: str, lookup: Tuple[Any, ...], values: dict[str, Any]
+    ) -> None:
+        """Cache the column values of the record found by a lookup."""
+        generation = self._generation(table_name)
+        self.backend.set(self.key(table_name, generation, "id", values["id"]), values)
+        if lookup[0] == "by":
+            self.backend.set(self.key(table_name, generation, *lookup), values["id"])
+
+    def invalidate(
+        self, table_name: str | None = None, object_ids: Iterable[Any] | None = None
+    ) -> None:
+        """Delete the cached values of the records of the table with the given IDs,
+        or where no IDs are given, all of the table's cached values. Where no table
+        is given either, clear the backend.
+        """
+        if table_name is None:
+            self.backend.clear()
+        elif object_ids is None:
+            self._start_generation(table_name)
+        else:
+            generation = self._generation(table_name)
+            for object_id in object_ids:
+                self.backend.delete(self.key(table_name, generation, "id", object_id))
+
+    def _generation(self, table_name: str) -> str:
+        """Return the table's current generation, starting one where there's none,
+        which may be because it was evicted or expired.
+        """
+        generation = self.backend.get(self.key(table_name, "generation"))
+        if generation is None:
+            generation = self._start_generation(table_name)
+        return generation
+
+    def _start_generation(self, table_name: str) -> str:
+        """Start a new generation of the table, invalidating all of its values
+        cached in earlier ones. Generations are random rather than counted, so
+        processes sharing the backend can't start the same one.
+        """
+        generation = uuid4().hex
+        self.backend.set(self.key(table_name, "generation"), generation)
+        return generation
+
+    @property
+    def hit_ratio(self) -> float:
+        """The proportion of lookups that were served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def reset_stats(self) -> None:
+        """Reset the hit and miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+
+_PENDING_INVALIDATIONS = "fideslib_pending_cache_invalidations"
+
+
+def invalidate_on_transaction_end(
+    session: Session,
+    cache: ModelCache,
+    table_name: str | None = None,
+    object_ids: Iterable[Any] | None = None,
+) -> None:
+    """Invalidate the cache again once the session's current transaction ends,
+    dropping anything cached from the database before the transaction's writes
+    were committed or rolled back.
+    """
+    session.info.setdefault(_PENDING_INVALIDATIONS, []).append(
+        (cache, table_name, None if object_ids is None else list(object_ids))
+    )
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_pending_caches(session: Session) -> None:
+    for cache, table_name, object_ids in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        cache.invalidate(table_name, object_ids)
+
+
+class SecondLevelCacheMixin(ModelMixin):
+    """Caching of the records fetched by OrmWrappedFidesBase's get and get_by.
+
+    Setting `second_level_cache` to a ModelCache caches the records across
+    sessions, until they expire or are written through the model's methods.
+    """
+
+    # When set, get and get_by are served from this cache where possible. Leave
+    # unset on models whose rows are written outside of these methods.
+    second_level_cache: ModelCache | None = None
+
+    @classmethod
+    def _get_cached(
+        cls,
+        db: Session,
+        lookup: Tuple[Any, ...],
+        load: Callable[[], Any],
+    ) -> Any:
+        """Return the record cached for a lookup, otherwise load and cache it.
+
+        Records aren't cached while the session has unflushed changes, as
+        loading would flush them and they might not be committed. Only the
+        columns loaded on the record are cached. Records are loaded from the
+        primary, as a lagging read replica could return values the cache was
+        just invalidated of.
+        """
+        cache = cls.second_level_cache
+        if cache is None:
+            return load()
+
+        table_name = cls.__tablename__
+        values = cache.get(table_name, lookup)
+        if values is not None:
+            obj = cls._get_loaded(db, values["id"])
+            if obj is not None:
+                return obj
+            return cls._load_column_values(db, [deepcopy(values)])[0]
+
+        cacheable = not (db.new or db.dirty or db.deleted)
+        with use_primary(db):
+            obj = load()
+        if obj is not None and cacheable:
+            loaded = inspect(obj).dict
+            cache.set(
+                table_name,
+                lookup,
+                deepcopy(
+                    {
+                        column_key: loaded[column_key]
+                        for column_key in cls.__mapper__.column_attrs.keys()  # type: ignore
+                        if column_key in loaded
+                    }
+                ),
+            )
+        return obj
+
+    @classmethod
+    def _invalidate_cache(
+        cls, db: Session | AsyncSession, object_ids: Iterable[Any] | None = None
+    ) -> None:
+        """Invalidate the model's second-level cache after writing to its table,
+        deleting the cached values of the records with the given IDs, or where
+        the records written aren't known, all of the records of its table.
+
+        Where the write hasn't been committed yet, the cache is invalidated again
+        once it is committed or rolled back.
+        """
+        cache = cls.second_level_cache
+        if cache is None:
+            return
+
+        table_name = cls.__tablename__
+        cache.invalidate(table_name, object_ids)
+        session = db.sync_session if isinstance(db, AsyncSession) else db
+        if isinstance(session, Session) and session.in_transaction():  # type: ignore
+            invalidate_on_transaction_end(session, cache, table_name, object_ids)
+
+    def _invalidate_cached_record(self, db: Session | AsyncSession) -> None:
+        """Invalidate the second-level cache after writing this record."""
+        identity = inspect(self).identity
+        self._invalidate_cache(db, object_ids=[identity[0]] if identity else None)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Iterable,
+    Sequence,
+    Type,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy import Table
+    from sqlalchemy.engine import Row  # type: ignore
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Mapper, Query, Session
+    from sqlalchemy.orm.attributes import InstrumentedAttribute
+    from sqlalchemy.sql.expression import BinaryExpression, BooleanClauseList, Select
+
+    from fideslib.db.base_class import ModelMetadata
+
+T = TypeVar("T", bound="ModelMixin")
+
+
+class ModelMixin:
+    """The base of the mixins OrmWrappedFidesBase is built from, declaring the
+    attributes and methods of the model that the mixins use from one another.
+
+    These are only declared for type checking, each is provided by the mapped
+    model, OrmWrappedFidesBase or one of its mixins.
+    """
+
+    if TYPE_CHECKING:
+        # pylint: disable=missing-function-docstring,unused-argument
+        __tablename__: ClassVar[str]
+        __table__: ClassVar[Table]
+        __mapper__: ClassVar[Mapper]
+        id: Any
+        refresh_after_persist: ClassVar[bool]
+
+        def __init__(self, **kwargs: Any) -> None: ...
+
+        @classmethod
+        def get_model_metadata(cls) -> ModelMetadata: ...
+
+        @classmethod
+        def query(
+            cls,
+            db: Session,
+            *,
+            only: Sequence[str] | None = None,
+            defer: Sequence[str] | None = None,
+            undefer_group: str | None = None,
+        ) -> Query: ...
+
+        @classmethod
+        def _loader_options(
+            cls,
+            *,
+            only: Sequence[str] | None = None,
+            defer: Sequence[str] | None = None,
+            undefer_group: str | None = None,
+        ) -> list[Any]: ...
+
+        @classmethod
+        def _get_column_attributes(
+            cls, names: Sequence[str]
+        ) -> list[InstrumentedAttribute]: ...
+
+        @classmethod
+        def _get_loaded(cls: Type[T], db: Session, object_id: Any) -> T | None: ...
+
+        @classmethod
+        def _load_returned_rows(
+            cls: Type[T], db: Session, rows: list[Row]
+        ) -> list[T]: ...
+
+        @classmethod
+        def _load_column_values(
+            cls: Type[T], db: Session, rows: list[dict[str, Any]]
+        ) -> list[T]: ...
+
+        @classmethod
+        def _check_bulk_key_or_name_collisions(
+            cls, db: Session, rows: list[dict[str, Any]]
+        ) -> None: ...
+
+        @classmethod
+        def _key_or_name_collisions_statement(
+            cls, rows: list[dict[str, Any]]
+        ) -> Select | None: ...
+
+        @classmethod
+        def _raise_key_or_name_collision(
+            cls, existing_rows: Iterable[Row], rows: list[dict[str, Any]]
+        ) -> None: ...
+
+        @classmethod
+        def _with_version_increment(cls, values: dict[str, Any]) -> dict[str, Any]: ...
+
+        @classmethod
+        def _invalidate_cache(
+            cls,
+            db: Session | AsyncSession,
+            object_ids: Iterable[Any] | None = None,
+        ) -> None: ...
+
+        def _invalidate_cached_record(self, db: Session | AsyncSession) -> None: ...
+
+        def validate_key(self) -> None: ...
+
+        @classmethod
+        def select_rows(
+            cls,
+            *,
+            columns: Sequence[str] | None = None,
+            conditions: BinaryExpression | BooleanClauseList | None = None,
+        ) -> Select: ...
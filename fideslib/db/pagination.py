@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import date, datetime
+from typing import Any, Iterator, NamedTuple, Sequence, Type, TypeVar
+
+from fastapi_pagination.api import create_page, resolve_params
+from fastapi_pagination.bases import AbstractPage, AbstractParams
+from fastapi_pagination.ext.sqlalchemy import paginate_query
+from sqlalchemy import Column, inspect, select, table, tuple_
+from sqlalchemy.engine import Row  # type: ignore
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.sql import func
+from sqlalchemy.sql.expression import (
+    BinaryExpression,
+    BooleanClauseList,
+    ColumnClause,
+)
+
+from fideslib.db.cache import LRUCacheBackend
+from fideslib.db.model_mixin import ModelMixin
+from fideslib.db.util import BULK_CHUNK_SIZE
+
+T = TypeVar("T", bound="PaginationMixin")
+
+# How `count` counts rows. "estimate" uses the planner's row count for the table,
+# where there are no conditions and the estimate is at least
+# ESTIMATED_COUNT_THRESHOLD, as smaller counts are cheap to make exactly and
+# more affected by stale statistics. "cached" reuses exact counts for
+# COUNT_CACHE_TTL_SECONDS.
+COUNT_MODES = ("exact", "estimate", "cached")
+ESTIMATED_COUNT_THRESHOLD = 10000
+COUNT_CACHE_TTL_SECONDS = 10.0
+_count_cache = LRUCacheBackend(ttl=COUNT_CACHE_TTL_SECONDS)
+# The planner's statistics for each table, read for estimated counts
+PG_CLASS = table("pg_class", ColumnClause("oid"), ColumnClause("reltuples"))
+
+
+class KeysetPage(NamedTuple):
+    """A page of records, and the cursor to pass as `after` to fetch the next page.
+
+    `next_cursor` is None on the last page.
+    """
+
+    items: list[Any]
+    next_cursor: str | None
+
+
+def _encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the ordering values of the last record on a page as an opaque cursor."""
+    serialized = [
+        value.isoformat() if isinstance(value, (date, datetime)) else value
+        for value in values
+    ]
+    return urlsafe_b64encode(json.dumps(serialized).encode("UTF-8")).decode("UTF-8")
+
+
+def _decode_cursor(cursor: str, columns: Sequence[Any]) -> list[Any]:
+    """Decode a cursor created by `_encode_cursor` for the given ordering columns."""
+    try:
+        serialized = json.loads(urlsafe_b64decode(cursor.encode("UTF-8")))
+    except (BinasciiError, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor {cursor}") from exc
+    if not isinstance(serialized, list) or len(serialized) != len(columns):
+        raise ValueError(f"Invalid cursor {cursor}")
+
+    values = []
+    for value, column in zip(serialized, columns):
+        python_type = column.type.python_type
+        if value is not None and python_type in (date, datetime):
+            try:
+                value = python_type.fromisoformat(value)
+            except (TypeError, ValueError) as exc:
+                raise ValueError(f"Invalid cursor {cursor}") from exc
+        values.append(value)
+    return values
+
+
+def _after_cursor(cursor: str, columns: Sequence[Any], descending: bool) -> Any:
+    """Return the condition selecting the records after the cursor, in the order of
+    the given ordering columns.
+    """
+    values = tuple_(
+        *_decode_cursor(cursor, columns),
+        types=[column.type for column in columns],
+    )
+    if descending:
+        return tuple_(*columns) < values
+    return tuple_(*columns) > values
+
+
+class PaginationMixin(ModelMixin):
+    """Methods of OrmWrappedFidesBase for reading records a page, or a batch, at a
+    time, and counting them:
+    - iter_all() / iter_filter(conditions): stream records in batches, rather than
+        loading them all into memory
+    - paginate_keyset(order_by, after, limit): return a page of records after a cursor
+    - count(conditions, mode): count the records that satisfy filter conditions,
+        exactly, estimated from planner statistics, or cached briefly
+    - paginate(params, conditions): return a fastapi-pagination page of records
+    """
+
+    @classmethod
+    def iter_all(
+        cls: Type[T], db: Session, *, batch_size: int = BULK_CHUNK_SIZE
+    ) -> Iterator[T]:
+        """Stream all database records in table, see `iter_query`."""
+        return cls.iter_query(db, db.query(cls), batch_size=batch_size)
+
+    @classmethod
+    def iter_filter(
+        cls: Type[T],
+        db: Session,
+        *,
+        conditions: BinaryExpression | BooleanClauseList,
+        batch_size: int = BULK_CHUNK_SIZE,
+    ) -> Iterator[T]:
+        """Stream the database records that satisfy the filter conditions, see
+        `iter_query`.
+        """
+        return cls.iter_query(
+            db, db.query(cls).filter(conditions), batch_size=batch_size
+        )
+
+    @staticmethod
+    def iter_query(
+        db: Session, query: Query, *, batch_size: int = BULK_CHUNK_SIZE
+    ) -> Iterator[Any]:
+        """Stream the results of a query.
+
+        Rows are read from a server-side cursor `batch_size` at a time, and each
+        object is expunged from the session once the next one is requested, so
+        memory use stays flat however many rows there are. Objects the session
+        already had before iterating, and objects changed or deleted while
+        iterating, are left in the session so their changes aren't lost.
+        Expunged objects can't lazy load relationships, and the session mustn't
+        be committed until iteration is finished, as that closes the cursor.
+        """
+        loaded_before = set(db.identity_map.keys())
+        for obj in query.yield_per(batch_size):
+            yield obj
+            state = inspect(obj)
+            if (
+                state.key in loaded_before
+                or state.modified
+                or state.session is not db
+                or obj in db.deleted
+            ):
+                continue
+            db.expunge(obj)
+
+    @classmethod
+    def paginate_keyset(
+        cls: Type[T],
+        db: Session,
+        *,
+        order_by: Sequence[Column | InstrumentedAttribute | str] = ("id",),
+        after: str | None = None,
+        limit: int = 50,
+        descending: bool = False,
+        conditions: BinaryExpression | BooleanClauseList | None = None,
+    ) -> KeysetPage:
+        """Fetch a page of records after the given cursor, ordered by `order_by`.
+
+        Pages are found with a row comparison on the ordering columns rather than
+        an OFFSET, and no COUNT is run, so fetching any page costs the same where
+        an index covers the ordering columns, in order. The ordering columns
+        should be unique together, so include `id` last. The default, `id`, uses
+        the primary key index, and orders records by creation time where IDs
+        are time-ordered, as they are by default.
+        """
+        if limit < 1:
+            raise ValueError(f"Invalid limit {limit}, must be at least 1.")
+
+        columns = [
+            getattr(cls, column) if isinstance(column, str) else column
+            for column in order_by
+        ]
+        query = db.query(cls)
+        if conditions is not None:
+            query = query.filter(conditions)
+        if after is not None:
+            query = query.filter(_after_cursor(after, columns, descending))
+
+        query = query.order_by(
+            *[column.desc() if descending else column.asc() for column in columns]
+        )
+        items = query.limit(limit + 1).all()
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = _encode_cursor(
+                [getattr(items[-1], column.key) for column in columns]
+            )
+        return KeysetPage(items=items, next_cursor=next_cursor)
+
+    @classmethod
+    def count(
+        cls,
+        db: Session,
+        *,
+        conditions: BinaryExpression | BooleanClauseList | None = None,
+        mode: str = "exact",
+    ) -> int:
+        """Count the records that satisfy the filter conditions, if any, using one
+        of the `COUNT_MODES`.
+        """
+        if mode not in COUNT_MODES:
+            raise ValueError(
+                f"Invalid count mode {mode}, must be one of {', '.join(COUNT_MODES)}."
+            )
+
+        model_table = cls.__table__
+        statement = select(func.count()).select_from(model_table)
+        if conditions is not None:
+            statement = statement.where(conditions)
+
+        if mode == "estimate" and conditions is None:
+            # A select rather than textual SQL, so it can be sent to a read replica
+            estimate = db.execute(
+                select(PG_CLASS.c.reltuples).where(  # type: ignore
+                    PG_CLASS.c.oid == func.to_regclass(model_table.fullname)
+                )
+            ).scalar()
+            # reltuples is -1 where the table has never been analyzed
+            if estimate is not None and estimate >= ESTIMATED_COUNT_THRESHOLD:
+                return int(estimate)
+
+        if mode != "cached":
+            return db.execute(statement).scalar()
+
+        # The bind for the model, not the one the session would route a statement
+        # to, as asking for that without a statement pins it to the primary
+        bind = Session.get_bind(db, mapper=cls.__mapper__)
+        compiled = statement.compile(dialect=bind.dialect)
+        key = (
+            repr(bind.engine.url),
+            str(compiled),
+            repr(sorted(compiled.params.items())),
+        )
+        count = _count_cache.get(key)
+        if count is None:
+            count = db.execute(statement).scalar()
+            _count_cache.set(key, count)
+        return count
+
+    @classmethod
+    def paginate(
+        cls: Type[T],
+        db: Session,
+        *,
+        params: AbstractParams | None = None,
+        conditions: BinaryExpression | BooleanClauseList | None = None,
+        order_by: Sequence[Any] = (),
+        count_mode: str = "exact",
+        only: Sequence[str] | None = None,
+        defer: Sequence[str] | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> AbstractPage[T] | AbstractPage[Row]:
+        """Return a page of the records that satisfy the filter conditions, if any,
+        with the total counted with `count` in the given mode.
+
+        Where `columns` are given, the page holds rows of those columns, as
+        returned by `filter_rows`, rather than objects.
+        """
+        params = resolve_params(params)
+        total = cls.count(db, conditions=conditions, mode=count_mode)
+
+        if columns is not None:
+            statement = cls.select_rows(columns=columns, conditions=conditions)
+            items = db.execute(
+                paginate_query(statement.order_by(*order_by), params)
+            ).all()
+            return create_page(items, total, params)
+
+        query = cls.query(db, only=only, defer=defer)
+        if conditions is not None:
+            query = query.filter(conditions)
+        items = paginate_query(query.order_by(*order_by), params).all()
+        return create_page(items, total, params)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.engine import Row  # type: ignore
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import BinaryExpression, BooleanClauseList, Select
+
+from fideslib.db.model_mixin import ModelMixin
+
+
+class RowModeMixin(ModelMixin):
+    """Methods of OrmWrappedFidesBase for reading the columns of records as rows,
+    without building or tracking objects:
+    - select_rows(columns, conditions): a select of the given columns, to execute
+    - get_row(id) / filter_rows(conditions): return the selected columns of records
+        as rows or dicts
+    - exists(conditions): return whether any record satisfies filter conditions
+    """
+
+    @classmethod
+    def select_rows(
+        cls,
+        *,
+        columns: Sequence[str] | None = None,
+        conditions: BinaryExpression | BooleanClauseList | None = None,
+    ) -> Select:
+        """Create a select of the given columns, or all undeferred columns, for
+        rows within the filter conditions, if any, to be executed in row mode.
+        """
+        if columns is None:
+            attributes = [
+                prop.class_attribute
+                for prop in cls.__mapper__.column_attrs  # type: ignore
+                if not prop.deferred
+            ]
+        else:
+            attributes = cls._get_column_attributes(columns)
+        statement = select(*attributes)
+        if conditions is not None:
+            statement = statement.where(conditions)
+        return statement
+
+    @classmethod
+    def get_row(
+        cls,
+        db: Session,
+        *,
+        object_id: Any,
+        columns: Sequence[str] | None = None,
+        as_dict: bool = False,
+    ) -> Row | dict[str, Any] | None:
+        """Fetch the given columns of a database record via a table ID, as a named
+        tuple row, or a dict if `as_dict` is set, without building an object.
+        """
+        statement = cls.select_rows(columns=columns, conditions=cls.id == object_id)
+        row = db.execute(statement).first()
+        if row is None or not as_dict:
+            return row
+        return dict(row._mapping)  # pylint: disable=protected-access
+
+    @classmethod
+    def filter_rows(
+        cls,
+        db: Session,
+        *,
+        conditions: BinaryExpression | BooleanClauseList | None = None,
+        columns: Sequence[str] | None = None,
+        order_by: Sequence[Any] = (),
+        as_dicts: bool = False,
+    ) -> list[Row] | list[dict[str, Any]]:
+        """Fetch the given columns of the records within the filter conditions, if
+        any, as named tuple rows, or dicts if `as_dicts` is set.
+
+        No objects are built or tracked by the session, so this is cheaper than
+        `filter` for reads that only serialize the records. Rows are accepted
+        by schemas with `orm_mode`, like those based on FidesSchema.
+        """
+        statement = cls.select_rows(columns=columns, conditions=conditions)
+        result = db.execute(statement.order_by(*order_by))
+        if as_dicts:
+            return [dict(row) for row in result.mappings()]
+        return result.all()
+
+    @classmethod
+    def exists(
+        cls, db: Session, *, conditions: BinaryExpression | BooleanClauseList
+    ) -> bool:
+        """Return whether any record satisfies the filter conditions, with a
+        SELECT EXISTS query rather than loading a record.
+        """
+        return db.query(db.query(cls).filter(conditions).exists()).scalar()
@@ -1,27 +1,42 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager, contextmanager
+from itertools import count
+from threading import Lock
+from typing import Any, AsyncIterator, Dict, Iterator, Sequence, Tuple
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
-from sqlalchemy.engine.url import URL
+from sqlalchemy import create_engine, pool
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.engine.url import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql import Select
 
 from fideslib.core.config import FidesConfig
 from fideslib.exceptions import MissingConfig
 
 logger = logging.getLogger(__name__)
 
+EngineKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
 
-def get_db_engine(
-    *,
-    config: FidesConfig | None = None,
-    database_uri: str | URL | None = None,
-) -> Engine:
-    """Return a database engine.
+_engines: Dict[EngineKey, Engine] = {}
+_session_factories: Dict[
+    Tuple[EngineKey, bool, bool, Tuple[EngineKey, ...]], sessionmaker
+] = {}
+_async_engines: Dict[EngineKey, AsyncEngine] = {}
+_async_session_factories: Dict[Tuple[EngineKey, bool], sessionmaker] = {}
+_registry_lock = Lock()
 
-    If the TESTING environment var is set the database engine returned will be
-    connected to the test DB.
+_UNIT_OF_WORK = "fideslib_unit_of_work"
+
+
+def _get_database_uri(
+    config: FidesConfig | None,
+    database_uri: str | URL | None,
+) -> str | URL:
+    """Return the database_uri if one is passed in, otherwise the one from the
+    config appropriate for the current mode.
     """
     if config is None and database_uri is None:
         raise ValueError("Either a config or database_uri is required")
@@ -32,7 +47,152 @@ def get_db_engine(
             database_uri = config.database.sqlalchemy_test_database_uri
         else:
             database_uri = config.database.sqlalchemy_database_uri
-    return create_engine(database_uri, pool_pre_ping=True)
+    return database_uri  # type: ignore
+
+
+def _get_engine_options(config: FidesConfig | None) -> Dict[str, Any]:
+    """Return the keyword arguments used to create an engine.
+
+    Connection pool settings are taken from the config where one is passed in,
+    any that are unset are left to the SQLAlchemy defaults.
+    """
+    if config is None:
+        return {"pool_pre_ping": True}
+
+    database = config.database
+    options: Dict[str, Any] = {"pool_pre_ping": database.pool_pre_ping}
+    if database.pool_class is not None:
+        options["poolclass"] = getattr(pool, database.pool_class)
+    for option in ("pool_size", "max_overflow", "pool_timeout", "pool_recycle"):
+        value = getattr(database, option)
+        if value is not None:
+            options[option] = value
+    if database.connect_args:
+        options["connect_args"] = database.connect_args
+    return options
+
+
+def get_db_engine(
+    *,
+    config: FidesConfig | None = None,
+    database_uri: str | URL | None = None,
+) -> Engine:
+    """Return a database engine.
+
+    If the TESTING environment var is set the database engine returned will be
+    connected to the test DB.
+
+    A new engine, with its own connection pool, is created on each call. Use
+    `get_shared_db_engine` to reuse one engine across the process.
+    """
+    database_uri = _get_database_uri(config, database_uri)
+    return create_engine(database_uri, **_get_engine_options(config))
+
+
+def _get_async_database_uri(database_uri: str | URL) -> URL:
+    """Return the database_uri using the asyncpg driver."""
+    url = make_url(database_uri)  # type: ignore
+    if url.drivername in ("postgresql", "postgresql+psycopg2"):
+        url = url.set(drivername="postgresql+asyncpg")  # type: ignore
+    return url
+
+
+def _get_async_engine_options(config: FidesConfig | None) -> Dict[str, Any]:
+    """Return the keyword arguments used to create an async engine.
+
+    These are the same as for a sync engine, except that a QueuePool is swapped
+    for its asyncio equivalent.
+    """
+    options = _get_engine_options(config)
+    if options.get("poolclass") is pool.QueuePool:
+        options["poolclass"] = pool.AsyncAdaptedQueuePool
+    return options
+
+
+def get_async_db_engine(
+    *,
+    config: FidesConfig | None = None,
+    database_uri: str | URL | None = None,
+) -> AsyncEngine:
+    """Return an asyncio database engine, using the asyncpg driver.
+
+    The database URI is chosen in the same way as `get_db_engine`, and a
+    `postgresql://` URI will be switched over to `postgresql+asyncpg://`.
+    """
+    database_uri = _get_async_database_uri(_get_database_uri(config, database_uri))
+    return create_async_engine(database_uri, **_get_async_engine_options(config))
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable version of an engine option value."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(val) for val in value)
+    return value
+
+
+def _get_engine_key(database_uri: str | URL, options: Dict[str, Any]) -> EngineKey:
+    """The key an engine is registered under, the URI and options it was built with."""
+    if isinstance(database_uri, URL):
+        uri = database_uri.render_as_string(hide_password=False)  # type: ignore
+    else:
+        uri = database_uri
+    return uri, _freeze(options)
+
+
+def get_shared_db_engine(
+    *,
+    config: FidesConfig | None = None,
+    database_uri: str | URL | None = None,
+) -> Engine:
+    """Return the process-wide database engine for the database URI.
+
+    The engine is created on first use and then reused, so connections are
+    pooled across callers. Call `dispose_all` on shutdown to close them.
+    """
+    database_uri = _get_database_uri(config, database_uri)
+    options = _get_engine_options(config)
+    key = _get_engine_key(database_uri, options)
+
+    engine = _engines.get(key)
+    if engine is None:
+        with _registry_lock:
+            engine = _engines.get(key)
+            if engine is None:
+                engine = create_engine(database_uri, **options)
+                _engines[key] = engine
+    return engine
+
+
+def get_shared_async_db_engine(
+    *,
+    config: FidesConfig | None = None,
+    database_uri: str | URL | None = None,
+) -> AsyncEngine:
+    """Return the process-wide asyncio database engine for the database URI.
+
+    Call `dispose_all_async` on shutdown to close its connections.
+    """
+    database_uri = _get_async_database_uri(_get_database_uri(config, database_uri))
+    options = _get_async_engine_options(config)
+    key = _get_engine_key(database_uri, options)
+
+    engine = _async_engines.get(key)
+    if engine is None:
+        with _registry_lock:
+            engine = _async_engines.get(key)
+            if engine is None:
+                engine = create_async_engine(database_uri, **options)
+                _async_engines[key] = engine
+    return engine
+
+
+def _get_replica_database_uris(config: FidesConfig) -> list[str]:
+    """Return the read replica URIs from the config, there are none in test mode."""
+    if config.is_test_mode:
+        return []
+    return config.database.sqlalchemy_replica_database_uris
 
 
 def get_db_session(
@@ -40,22 +200,301 @@ def get_db_session(
     autocommit: bool = False,
     autoflush: bool = False,
     engine: Engine | None = None,
+    replica_engines: Sequence[Engine] | None = None,
 ) -> sessionmaker:
-    """Return a database SessionLocal."""
+    """Return a database SessionLocal.
+
+    Where read replicas are passed in, or configured, the sessions send their
+    SELECTs to them, see ExtendedSession. Configured replicas use the shared
+    engines, so calling this repeatedly doesn't leave engines behind, and
+    `dispose_all` closes them.
+    """
     if not config.database.sqlalchemy_database_uri:
         raise MissingConfig("No database uri available in the config")
 
+    if replica_engines is None:
+        replica_engines = [
+            get_shared_db_engine(config=config, database_uri=database_uri)
+            for database_uri in _get_replica_database_uris(config)
+        ]
+
     return sessionmaker(
         autocommit=autocommit,
         autoflush=autoflush,
         bind=engine or get_db_engine(config=config),
         class_=ExtendedSession,
+        replicas=(
+            ReplicaSet(replica_engines, config.database.replica_selection)
+            if replica_engines
+            else None
+        ),
     )
 
 
+def get_shared_db_session(
+    config: FidesConfig,
+    autocommit: bool = False,
+    autoflush: bool = False,
+) -> sessionmaker:
+    """Return the process-wide SessionLocal, bound to the shared database engine."""
+    if not config.database.sqlalchemy_database_uri:
+        raise MissingConfig("No database uri available in the config")
+
+    database_uri = _get_database_uri(config, None)
+    options = _get_engine_options(config)
+    replica_database_uris = _get_replica_database_uris(config)
+    key = (
+        _get_engine_key(database_uri, options),
+        autocommit,
+        autoflush,
+        tuple(
+            _get_engine_key(replica_database_uri, options)
+            for replica_database_uri in replica_database_uris
+        ),
+    )
+
+    session_factory = _session_factories.get(key)
+    if session_factory is None:
+        engine = get_shared_db_engine(config=config)
+        replica_engines = [
+            get_shared_db_engine(config=config, database_uri=replica_database_uri)
+            for replica_database_uri in replica_database_uris
+        ]
+        with _registry_lock:
+            session_factory = _session_factories.get(key)
+            if session_factory is None:
+                session_factory = get_db_session(
+                    config,
+                    autocommit=autocommit,
+                    autoflush=autoflush,
+                    engine=engine,
+                    replica_engines=replica_engines,
+                )
+                _session_factories[key] = session_factory
+    return session_factory
+
+
+def get_async_db_session(
+    config: FidesConfig,
+    autoflush: bool = False,
+    engine: AsyncEngine | None = None,
+) -> sessionmaker:
+    """Return an asyncio database SessionLocal.
+
+    Objects are not expired on commit, as loading expired attributes would need
+    IO that can't happen implicitly under asyncio.
+    """
+    if not config.database.sqlalchemy_database_uri:
+        raise MissingConfig("No database uri available in the config")
+
+    return sessionmaker(
+        autoflush=autoflush,
+        bind=engine or get_async_db_engine(config=config),
+        class_=AsyncExtendedSession,
+        expire_on_commit=False,
+    )
+
+
+def get_shared_async_db_session(
+    config: FidesConfig,
+    autoflush: bool = False,
+) -> sessionmaker:
+    """Return the process-wide asyncio SessionLocal, bound to the shared asyncio
+    database engine.
+    """
+    if not config.database.sqlalchemy_database_uri:
+        raise MissingConfig("No database uri available in the config")
+
+    database_uri = _get_async_database_uri(_get_database_uri(config, None))
+    key = (
+        _get_engine_key(database_uri, _get_async_engine_options(config)),
+        autoflush,
+    )
+
+    session_factory = _async_session_factories.get(key)
+    if session_factory is None:
+        engine = get_shared_async_db_engine(config=config)
+        with _registry_lock:
+            session_factory = _async_session_factories.get(key)
+            if session_factory is None:
+                session_factory = get_async_db_session(
+                    config,
+                    autoflush=autoflush,
+                    engine=engine,
+                )
+                _async_session_factories[key] = session_factory
+    return session_factory
+
+
+def dispose_all() -> None:
+    """Dispose of every shared engine, closing their pooled connections.
+
+    Subsequent calls to `get_shared_db_engine` or `get_shared_db_session` will
+    create new engines. Shared asyncio engines are left alone, as they can only
+    be disposed of from an event loop, use `dispose_all_async` for those.
+    """
+    with _registry_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+        _session_factories.clear()
+
+    for engine in engines:
+        engine.dispose()
+
+
+async def dispose_all_async() -> None:
+    """Dispose of every shared engine, both sync and asyncio."""
+    dispose_all()
+
+    with _registry_lock:
+        async_engines = list(_async_engines.values())
+        _async_engines.clear()
+        _async_session_factories.clear()
+
+    for async_engine in async_engines:
+        await async_engine.dispose()
+
+
+def in_unit_of_work(db: Session | AsyncSession) -> bool:
+    """Return whether the session is within a unit of work."""
+    session = db.sync_session if isinstance(db, AsyncSession) else db
+    return isinstance(session, Session) and _UNIT_OF_WORK in session.info
+
+
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    """Group the writes made within the block into a single transaction.
+
+    Within the block the model methods that would commit, like `create`, `save`
+    and `delete`, only flush. The session is committed once at the end of the
+    block, or rolled back if it raises. A nested block joins the outer one.
+
+    The final commit doesn't expire the objects in the session, as their
+    values were written or loaded within the transaction.
+    """
+    if in_unit_of_work(db):
+        yield db
+        return
+
+    db.info[_UNIT_OF_WORK] = True
+    try:
+        yield db
+        expire_on_commit = db.expire_on_commit
+        db.expire_on_commit = False
+        try:
+            db.commit()
+        finally:
+            db.expire_on_commit = expire_on_commit
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.info.pop(_UNIT_OF_WORK, None)
+
+
+@asynccontextmanager
+async def async_unit_of_work(db: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """The asyncio counterpart of `unit_of_work`."""
+    if in_unit_of_work(db):
+        yield db
+        return
+
+    session = db.sync_session
+    session.info[_UNIT_OF_WORK] = True
+    try:
+        yield db
+        expire_on_commit = session.expire_on_commit
+        session.expire_on_commit = False
+        try:
+            await db.commit()
+        finally:
+            session.expire_on_commit = expire_on_commit
+    except Exception:
+        await db.rollback()
+        raise
+    finally:
+        session.info.pop(_UNIT_OF_WORK, None)
+
+
+class ReplicaSet:
+    """The read replica engines shared by the sessions of a SessionLocal, and the
+    strategy used to choose one for each session: `round_robin`, or
+    `least_connections` to choose the one with the fewest checked out
+    connections.
+    """
+
+    def __init__(
+        self, engines: Sequence[Engine], selection: str = "round_robin"
+    ) -> None:
+        if not engines:
+            raise ValueError("At least one replica engine is required")
+        self.engines = list(engines)
+        self.selection = selection
+        self._counter = count()
+
+    def choose(self) -> Engine:
+        """Return the replica to use for a session."""
+        if self.selection == "least_connections":
+            return min(self.engines, key=_get_checked_out_connections)
+        return self.engines[next(self._counter) % len(self.engines)]
+
+
+def _get_checked_out_connections(engine: Engine) -> int:
+    """Return the number of connections in use from the engine's pool."""
+    checkedout = getattr(engine.pool, "checkedout", None)
+    return checkedout() if checkedout is not None else 0
+
+
 class ExtendedSession(Session):
     """This class wraps the SQLAlchemy Session to provide some error handling on
-    commits."""
+    commits, and to send reads to read replicas where there are any.
+
+    Plain SELECTs go to one replica, chosen when the session first reads. Once
+    the session executes anything else, including flushes, SELECT ... FOR
+    UPDATE and textual SQL, it uses the primary until it's closed, so it
+    reads its own writes even after committing them. Use `use_primary` to
+    read from the primary before writing.
+    """
+
+    def __init__(
+        self, *args: Any, replicas: ReplicaSet | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self._replica: Engine | None = None
+        self._pinned_to_primary = False
+        self._use_primary_depth = 0
+
+    @contextmanager
+    def use_primary(self) -> Iterator[ExtendedSession]:
+        """Send everything, including reads, to the primary within the block."""
+        self._use_primary_depth += 1
+        try:
+            yield self
+        finally:
+            self._use_primary_depth -= 1
+
+    def get_bind(  # type: ignore
+        self, mapper: Any = None, clause: Any = None, **kwargs: Any
+    ) -> Engine | Connection:
+        """Return the replica for plain SELECTs, otherwise the primary."""
+        primary = super().get_bind(mapper=mapper, clause=clause, **kwargs)
+        if self.replicas is None or self._pinned_to_primary or self._use_primary_depth:
+            return primary
+
+        if not _is_read_only(clause):
+            self._pinned_to_primary = True
+            return primary
+
+        if self._replica is None:
+            self._replica = self.replicas.choose()
+        return self._replica
+
+    def close(self) -> None:
+        """Close the session, after which it will choose a replica afresh."""
+        super().close()
+        self._replica = None
+        self._pinned_to_primary = False
 
     def commit(self) -> None:
         """Provide the option to automatically rollback failed transactions."""
@@ -66,3 +505,41 @@ class ExtendedSession(Session):
             # Rollback the current transaction after each failed commit
             self.rollback()
             raise
+
+
+@contextmanager
+def use_primary(db: Session) -> Iterator[Session]:
+    """Send everything the session executes within the block, including reads, to
+    the primary, where it's an ExtendedSession with read replicas. Any other
+    session is left as it is.
+    """
+    if isinstance(db, ExtendedSession):
+        with db.use_primary():
+            yield db
+    else:
+        yield db
+
+
+def _is_read_only(clause: Any) -> bool:
+    """Return whether a statement is a plain SELECT, without a locking clause."""
+    return (
+        isinstance(clause, Select)
+        and clause._for_update_arg is None  # type: ignore # pylint: disable=protected-access
+    )
+
+
+# AsyncSession itself leaves the abstract _regenerate_proxy_for_target of its
+# proxy base unimplemented, it's only needed to wrap an existing Session
+class AsyncExtendedSession(AsyncSession):  # pylint: disable=abstract-method
+    """This class wraps the SQLAlchemy AsyncSession to provide the same error
+    handling on commits as ExtendedSession."""
+
+    async def commit(self) -> None:
+        """Provide the option to automatically rollback failed transactions."""
+        try:
+            return await super().commit()
+        except Exception as exc:
+            logger.error("Exception: %s", exc)
+            # Rollback the current transaction after each failed commit
+            await self.rollback()
+            raise
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator
+
+from fideslang.models import FidesKey  # type: ignore
+from sqlalchemy import ARRAY, any_, bindparam, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.exc import StaleDataError
+
+from fideslib.db.session import in_unit_of_work
+from fideslib.exceptions import KeyValidationError, StaleObjectError
+from fideslib.utils.text import to_snake_case
+
+if TYPE_CHECKING:
+    from fideslib.db.model_mixin import ModelMixin
+
+BULK_CHUNK_SIZE = 1000
+
+
+def get_key_from_data(data: dict[str, Any], cls_name: str) -> str:
+    """Extracts key from data, validates.
+
+    If no key, uses a snake-cased name. Will be used as the URL onupdate
+    applicable classes.
+    """
+    key = FidesKey.validate(data.get("key")) if data.get("key") else None
+    if key is None:
+        name = data.get("name")
+        if name is None:
+            raise KeyValidationError(f"{cls_name} requires a name.")
+        key = FidesKey.validate(to_snake_case(name))
+    return key
+
+
+def id_in(column: Any, ids: list[Any]) -> Any:
+    """Filter `column` to the given ids, with a single array parameter
+    (`id = ANY(:ids)`) rather than one parameter per id.
+    """
+    return column == any_(bindparam("ids", ids, type_=ARRAY(column.type)))
+
+
+def commit_or_flush(db: Session) -> None:
+    """Commit the session, or within a unit of work, where the commit is left to
+    the end of the unit, only flush it.
+    """
+    if in_unit_of_work(db):
+        db.flush()
+    else:
+        db.commit()
+
+
+async def async_commit_or_flush(db: AsyncSession) -> None:
+    """The asyncio counterpart of `commit_or_flush`."""
+    if in_unit_of_work(db):
+        await db.flush()
+    else:
+        await db.commit()
+
+
+def rollback_unless_in_unit_of_work(db: Session) -> None:
+    """Roll back the session after a failed write, unless within a unit of work,
+    which rolls back the whole unit when the error reaches it.
+    """
+    if not in_unit_of_work(db):
+        db.rollback()
+
+
+def get_column_values(resource: ModelMixin, inserted: bool) -> dict[str, Any]:
+    """Return the column values loaded on a resource that has just been flushed.
+
+    Server generated values will have been returned by the flush. Any other
+    column left unset on a newly inserted resource must be null.
+    """
+    state = inspect(resource)
+    values = {}
+    for key in state.mapper.column_attrs.keys():
+        if key in state.dict:
+            values[key] = state.dict[key]
+        elif inserted:
+            values[key] = None
+    return values
+
+
+def set_committed_column_values(resource: ModelMixin, values: dict[str, Any]) -> None:
+    """Set column values on a resource as though they had been loaded from the db,
+    so they don't need to be reloaded after the commit expired them.
+    """
+    for key, value in values.items():
+        set_committed_value(resource, key, value)
+
+
+def _is_versioned(resource: ModelMixin) -> bool:
+    return inspect(resource).mapper.version_id_col is not None
+
+
+def _stale_object_error(resource: ModelMixin) -> StaleObjectError:
+    identity = inspect(resource).identity
+    object_id = identity[0] if identity else None
+    return StaleObjectError(
+        f"{resource.__class__.__name__} {object_id} was changed or deleted by "
+        "another writer after it was loaded."
+    )
+
+
+@contextmanager
+def raise_stale_object_error(db: Session, resource: ModelMixin) -> Iterator[None]:
+    """Raise a StaleObjectError, after rolling back, where writing a resource of a
+    versioned model finds its row has a different version, or no longer exists.
+
+    Other models raise SQLAlchemy's StaleDataError as they always have.
+    """
+    versioned = _is_versioned(resource)
+    error = _stale_object_error(resource)
+    try:
+        yield
+    except StaleDataError as exc:
+        if not versioned:
+            raise
+        rollback_unless_in_unit_of_work(db)
+        raise error from exc
+
+
+@asynccontextmanager
+async def async_raise_stale_object_error(
+    db: AsyncSession, resource: ModelMixin
+) -> AsyncIterator[None]:
+    """The asyncio counterpart of `raise_stale_object_error`."""
+    versioned = _is_versioned(resource)
+    error = _stale_object_error(resource)
+    try:
+        yield
+    except StaleDataError as exc:
+        if not versioned:
+            raise
+        if not in_unit_of_work(db):
+            await db.rollback()
+        raise error from exc
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi import HTTPException, status
+from sqlalchemy.orm.exc import StaleDataError
 
 from fideslib.oauth.scopes import SCOPES
 
@@ -99,3 +100,7 @@ class KeyValidationError(Exception):
 
 class MissingConfig(Exception):
     """Custom exception for when no valid configuration file is provided."""
+
+
+class StaleObjectError(StaleDataError):
+    """The resource was changed or deleted by another writer after it was loaded."""
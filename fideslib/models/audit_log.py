@@ -19,6 +19,8 @@ class AuditLogAction(str, EnumType):
 class AuditLog(Base):
     """The log of all user actions within the system."""
 
+    refresh_after_persist = False
+
     user_id = Column(String, nullable=True, index=True)
     privacy_request_id = Column(String, nullable=True, index=True)
     action = Column(
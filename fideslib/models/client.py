@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import json
 from datetime import datetime
-from typing import Any
+from typing import Any, Sequence
 
 from sqlalchemy import ARRAY, Column, ForeignKey, String
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.declarative import declared_attr
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, deferred
 
 from fideslib.core.config import FidesConfig
 from fideslib.cryptography.cryptographic_util import (
@@ -30,12 +31,15 @@ DEFAULT_SCOPES: list[str] = []
 class ClientDetail(Base):
     """The persisted details about a client in the system"""
 
+    refresh_after_persist = False
+
     @declared_attr
     def __tablename__(self) -> str:
         return "client"
 
-    hashed_secret = Column(String, nullable=False)
-    salt = Column(String, nullable=False)
+    # Only needed to check credentials, so loaded together when first accessed
+    hashed_secret = deferred(Column(String, nullable=False), group="credentials")
+    salt = deferred(Column(String, nullable=False), group="credentials")
     scopes = Column(ARRAY(String), nullable=False, default="{}")
     fides_key = Column(String, index=True, unique=True, nullable=True)
     user_id = Column(
@@ -91,11 +95,43 @@ class ClientDetail(Base):
         object_id: Any,
         config: FidesConfig,
         scopes: list[str] | None = None,
+        only: Sequence[str] | None = None,
+        defer: Sequence[str] | None = None,
+        undefer_group: str | None = None,
     ) -> ClientDetail | None:
         """Fetch a database record via a client_id"""
         if object_id == config.security.oauth_root_client_id:
             return _get_root_client_detail(config, scopes)
-        return super().get(db, object_id=object_id)
+        return super().get(
+            db,
+            object_id=object_id,
+            only=only,
+            defer=defer,
+            undefer_group=undefer_group,
+        )
+
+    @classmethod
+    async def async_get(  # type: ignore
+        cls,
+        db: AsyncSession,
+        *,
+        object_id: Any,
+        config: FidesConfig,
+        scopes: list[str] | None = None,
+        only: Sequence[str] | None = None,
+        defer: Sequence[str] | None = None,
+        undefer_group: str | None = None,
+    ) -> ClientDetail | None:
+        """Fetch a database record via a client_id with an AsyncSession"""
+        if object_id == config.security.oauth_root_client_id:
+            return _get_root_client_detail(config, scopes)
+        return await super().async_get(
+            db,
+            object_id=object_id,
+            only=only,
+            defer=defer,
+            undefer_group=undefer_group,
+        )
 
     def create_access_code_jwe(self, encryption_key: str) -> str:
         """Generates a JWE from the client detail provided"""
@@ -122,19 +158,20 @@ def _get_root_client_detail(
     scopes: list[str] | None,
     encoding: str = "UTF-8",
 ) -> ClientDetail | None:
-    if not config.security.oauth_root_client_secret_hash:
+    root_client_secret_hash = config.security.get_oauth_root_client_secret_hash()
+    if not root_client_secret_hash:
         raise ValueError("A root client hash is required")
 
     if scopes:
-        return ClientDetail(
+        return ClientDetail(  # type: ignore
             id=config.security.oauth_root_client_id,
-            hashed_secret=config.security.oauth_root_client_secret_hash[0],
-            salt=config.security.oauth_root_client_secret_hash[1].decode(encoding),
+            hashed_secret=root_client_secret_hash[0],
+            salt=root_client_secret_hash[1].decode(encoding),
             scopes=scopes,
         )
 
-    return ClientDetail(
+    return ClientDetail(  # type: ignore
         id=config.security.oauth_root_client_id,
-        hashed_secret=config.security.oauth_root_client_secret_hash[0],
-        salt=config.security.oauth_root_client_secret_hash[1].decode(encoding),
+        hashed_secret=root_client_secret_hash[0],
+        salt=root_client_secret_hash[1].decode(encoding),
     )
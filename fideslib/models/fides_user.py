@@ -4,7 +4,8 @@ from datetime import datetime
 from typing import Any
 
 from sqlalchemy import Column, DateTime, String
-from sqlalchemy.orm import Session, relationship
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, deferred, relationship
 
 from fideslib.cryptography.cryptographic_util import generate_salt, hash_with_salt
 from fideslib.db.base_class import Base
@@ -14,11 +15,14 @@ from fideslib.models.audit_log import AuditLog
 class FidesUser(Base):
     """The DB ORM model for FidesUser."""
 
+    refresh_after_persist = False
+
     username = Column(String, unique=True, index=True)
     first_name = Column(String, nullable=True)
     last_name = Column(String, nullable=True)
-    hashed_password = Column(String, nullable=False)
-    salt = Column(String, nullable=False)
+    # Only needed to check credentials, so loaded together when first accessed
+    hashed_password = deferred(Column(String, nullable=False), group="credentials")
+    salt = deferred(Column(String, nullable=False), group="credentials")
     last_login_at = Column(DateTime(timezone=True), nullable=True)
     password_reset_at = Column(DateTime(timezone=True), nullable=True)
 
@@ -47,25 +51,32 @@ class FidesUser(Base):
         )
         return hashed_password, salt
 
+    @classmethod
+    def _get_user_data(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """Return the data to create a FidesUser with, the password replaced by its
+        hash with a generated salt and the salt"""
+        hashed_password, salt = FidesUser.hash_password(data["password"])
+        return {
+            "salt": salt,
+            "hashed_password": hashed_password,
+            "username": data["username"],
+            "first_name": data.get("first_name"),
+            "last_name": data.get("last_name"),
+        }
+
     @classmethod
     def create(cls, db: Session, data: dict[str, Any]) -> FidesUser:
         """Create a FidesUser by hashing the password with a generated salt
         and storing the hashed password and the salt"""
-        hashed_password, salt = FidesUser.hash_password(data["password"])
-
-        user = super().create(
-            db,
-            data={
-                "salt": salt,
-                "hashed_password": hashed_password,
-                "username": data["username"],
-                "first_name": data.get("first_name"),
-                "last_name": data.get("last_name"),
-            },
-        )
+        user = super().create(db, data=cls._get_user_data(data))
 
         return user  # type: ignore
 
+    @classmethod
+    async def async_create(cls, db: AsyncSession, *, data: dict[str, Any]) -> FidesUser:
+        """The asyncio counterpart of `create`, hashing the password the same way"""
+        return await super().async_create(db, data=cls._get_user_data(data))
+
     def credentials_valid(self, password: str, encoding: str = "UTF-8") -> bool:
         """Verifies that the provided password is correct."""
         provided_password_hash = hash_with_salt(
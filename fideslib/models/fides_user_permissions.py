@@ -12,6 +12,8 @@ from fideslib.oauth.scopes import PRIVACY_REQUEST_READ
 class FidesUserPermissions(Base):
     """The DB ORM model for FidesUserPermissions"""
 
+    refresh_after_persist = False
+
     user_id = Column(String, ForeignKey(FidesUser.id), nullable=False, unique=True)
     # escaping curly braces requires doubling them. Not a "\". So {{{test123}}}
     # renders as {test123}
@@ -1,12 +1,13 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from fastapi import Depends, Security
 from fastapi.security import SecurityScopes
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from fideslib.core.config import FidesConfig
 from fideslib.core.config import get_config as core_get_config
-from fideslib.db.session import get_db_session
+from fideslib.db.session import get_shared_async_db_session, get_shared_db_session
 from fideslib.models.client import ClientDetail
 from fideslib.oauth.api.urn_registry import TOKEN, V1_URL_PREFIX
 from fideslib.oauth.oauth_util import verify_oauth_client as verify
@@ -26,14 +27,24 @@ def get_db() -> Generator[Session, None, None]:
 
     This should be overridden by the installing package.
     """
+    SessionLocal = get_shared_db_session(core_get_config())
+    db = SessionLocal()
     try:
-        SessionLocal = get_db_session(core_get_config())
-        db = SessionLocal()
         yield db
     finally:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Return an asyncio database session, for routes run on the event loop.
+
+    This should be overridden by the installing package.
+    """
+    SessionLocal = get_shared_async_db_session(core_get_config())
+    async with SessionLocal() as db:
+        yield db
+
+
 def oauth2_scheme() -> OAuth2ClientCredentialsBearer:
     """Creates the oauth2 scheme from the token.
 
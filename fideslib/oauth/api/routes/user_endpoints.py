@@ -5,7 +5,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Security
 from fastapi_pagination import Page, Params
 from fastapi_pagination.bases import AbstractPage
-from fastapi_pagination.ext.sqlalchemy import paginate
+from sqlalchemy.engine import Row  # type: ignore
 from sqlalchemy.orm import Session
 from sqlalchemy_utils import escape_like
 from starlette.status import (
@@ -18,6 +18,7 @@ from starlette.status import (
 )
 
 from fideslib.core.config import FidesConfig
+from fideslib.db.session import unit_of_work, use_primary
 from fideslib.models.client import ADMIN_UI_ROOT, ClientDetail
 from fideslib.models.fides_user import FidesUser
 from fideslib.models.fides_user_permissions import FidesUserPermissions
@@ -72,18 +73,22 @@ def create_user(
             status_code=HTTP_400_BAD_REQUEST, detail="Username already exists."
         )
 
-    user = FidesUser.get_by(db, field="username", value=user_data.username)
-
-    if user:
+    # Read from the primary, as a lagging replica could miss a user just created
+    with use_primary(db):
+        username_exists = FidesUser.exists(
+            db, conditions=FidesUser.username == user_data.username
+        )
+    if username_exists:
         raise HTTPException(
             status_code=HTTP_400_BAD_REQUEST, detail="Username already exists."
         )
 
-    user = FidesUser.create(db=db, data=user_data.dict())
+    with unit_of_work(db):
+        user = FidesUser.create(db=db, data=user_data.dict())
+        FidesUserPermissions.create(
+            db=db, data={"user_id": user.id, "scopes": [PRIVACY_REQUEST_READ]}
+        )
     logger.info("Created user with id: '%s'.", user.id)
-    FidesUserPermissions.create(
-        db=db, data={"user_id": user.id, "scopes": [PRIVACY_REQUEST_READ]}
-    )
     return user
 
 
@@ -101,7 +106,8 @@ def delete_user(
     user_id: str,
 ) -> None:
     """Deletes the User and associated ClientDetail if applicable."""
-    user = FidesUser.get_by(db, field="id", value=user_id)
+    with use_primary(db):
+        user = FidesUser.get_by(db, field="id", value=user_id)
 
     if not user:
         raise HTTPException(
@@ -124,9 +130,11 @@ def delete_user(
     dependencies=[Security(verify_oauth_client, scopes=[USER_READ])],
     response_model=UserResponse,
 )
-def get_user(*, db: Session = Depends(get_db), user_id: str) -> FidesUser:
+def get_user(*, db: Session = Depends(get_db), user_id: str) -> Row:
     """Returns a User based on an Id"""
-    user: Optional[FidesUser] = FidesUser.get_by_key_or_id(db, data={"id": user_id})
+    user = FidesUser.get_row(
+        db, object_id=user_id, columns=UserResponse.get_field_names()
+    )
     if user is None:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -144,15 +152,22 @@ def get_users(
     db: Session = Depends(get_db),
     params: Params = Depends(),
     username: Optional[str] = None,
-) -> AbstractPage[FidesUser]:
+) -> AbstractPage[Row]:
     """Returns a paginated list of all users"""
-    query = FidesUser.query(db)
+    conditions = None
     if username:
-        query = query.filter(FidesUser.username.ilike(f"%{escape_like(username)}%"))
+        conditions = FidesUser.username.ilike(f"%{escape_like(username)}%")
 
     logger.info("Returning a paginated list of users.")
 
-    return paginate(query.order_by(FidesUser.created_at.desc()), params=params)
+    return FidesUser.paginate(
+        db,
+        params=params,
+        conditions=conditions,
+        order_by=[FidesUser.created_at.desc()],
+        count_mode="estimate",
+        columns=UserResponse.get_field_names(),
+    )
 
 
 @router.post(
@@ -197,9 +212,14 @@ def user_login(
             created_at=datetime.utcnow(),
         )
     else:
-        user_check: Optional[FidesUser] = FidesUser.get_by(
-            db, field="username", value=user_data.username
-        )
+        # The user is written to by the login, so is read from the primary
+        with use_primary(db):
+            user_check: Optional[FidesUser] = FidesUser.get_by(
+                db,
+                field="username",
+                value=user_data.username,
+                undefer_group="credentials",
+            )
 
         if not user_check:
             raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="No user found.")
@@ -236,21 +256,23 @@ def perform_login(
     user: FidesUser,
 ) -> ClientDetail:
     """Performs a login by updating the FidesUser instance and creating and returning
-    an associated ClientDetail.
+    an associated ClientDetail. The client and the login are committed together,
+    after reading the user's client and permissions from the primary.
     """
 
-    client = user.client
-    if not client:
-        logger.info("Creating client for login")
-        client, _ = ClientDetail.create_client_and_secret(
-            db,
-            client_id_byte_length,
-            client_secret_btye_length,
-            scopes=user.permissions.scopes,  # type: ignore
-            user_id=user.id,
-        )
+    with use_primary(db), unit_of_work(db):
+        client = user.client
+        if not client:
+            logger.info("Creating client for login")
+            client, _ = ClientDetail.create_client_and_secret(
+                db,
+                client_id_byte_length,
+                client_secret_btye_length,
+                scopes=user.permissions.scopes,  # type: ignore
+                user_id=user.id,
+            )
 
-    user.last_login_at = datetime.utcnow()
-    user.save(db)
+        user.last_login_at = datetime.utcnow()
+        user.save(db)
 
     return client
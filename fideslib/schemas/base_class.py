@@ -1,4 +1,5 @@
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, List, Tuple, Type
 
 from pydantic import BaseModel
 
@@ -8,8 +9,11 @@ class FidesSchema(BaseModel):
 
     @classmethod
     def get_field_names(cls) -> List[str]:
-        """Return a list of all field names specified on this schema."""
-        return list(cls.schema().get("properties", {}).keys())
+        """Return a list of all field names specified on this schema.
+
+        The names are read from the schema once per class and then reused.
+        """
+        return list(_get_field_names(cls))
 
     class Config:
         """Allow ORM access on all schemas."""
@@ -17,6 +21,11 @@ class FidesSchema(BaseModel):
         orm_mode = True
 
 
+@lru_cache(maxsize=None)
+def _get_field_names(schema: Type[FidesSchema]) -> Tuple[str, ...]:
+    return tuple(schema.schema().get("properties", {}).keys())
+
+
 BaseSchema = FidesSchema
 
 
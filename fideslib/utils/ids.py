@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import os
+from threading import Lock
+from time import time_ns
+from typing import Callable
+from uuid import UUID, uuid4
+
+_lock = Lock()
+_last_timestamp_ms = 0
+_last_counter = 0
+
+
+def uuid7() -> UUID:
+    """Returns a time-ordered version 7 UUID.
+
+    The first 48 bits are the unix timestamp in milliseconds and the next 12 bits
+    are a counter, started at a random value each millisecond, so the UUIDs
+    generated by a process sort in the order they were generated, both as
+    UUIDs and as strings. The remaining 62 bits are random.
+    """
+    global _last_timestamp_ms, _last_counter  # pylint: disable=global-statement
+
+    with _lock:
+        timestamp_ms = time_ns() // 1_000_000
+        if timestamp_ms > _last_timestamp_ms:
+            counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            # Within the same millisecond, or if the clock went backwards,
+            # carry on from the last UUID, moving on a millisecond when the
+            # counter overflows
+            timestamp_ms = _last_timestamp_ms
+            counter = _last_counter + 1
+            if counter > 0xFFF:
+                timestamp_ms += 1
+                counter = 0
+        _last_timestamp_ms = timestamp_ms
+        _last_counter = counter
+
+    random_bits = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    return UUID(
+        int=(timestamp_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | random_bits
+    )
+
+
+# The ways IDs can be generated. uuid7 IDs are ordered by creation time, so new
+# rows are added at the end of the primary key index rather than scattered
+# through it. Both have the same string format, so can be used in one table.
+ID_STRATEGIES: dict[str, Callable[[], UUID]] = {"uuid4": uuid4, "uuid7": uuid7}
+_id_strategy = "uuid7"
+
+
+def set_id_strategy(strategy: str) -> None:
+    """Sets the strategy, one of `ID_STRATEGIES`, used to generate new IDs."""
+    global _id_strategy  # pylint: disable=global-statement
+
+    if strategy not in ID_STRATEGIES:
+        raise ValueError(
+            f"Invalid ID strategy {strategy}, must be one of {', '.join(ID_STRATEGIES)}."
+        )
+    _id_strategy = strategy
+
+
+def generate_id(table_name: str | None = None) -> str:
+    """
+    Generates a uuid with a prefix based on the tablename, if one is given, to be
+    used as a record's ID value
+    """
+    prefix = f"{table_name[:3]}_" if table_name else ""
+    return f"{prefix}{ID_STRATEGIES[_id_strategy]()}"
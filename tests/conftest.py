@@ -1,14 +1,18 @@
 # pylint: disable=missing-function-docstring, redefined-outer-name
 
+import asyncio
 import json
 import logging
 import os
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
 from pathlib import Path
 from uuid import uuid4
 
 import pytest
 from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from sqlalchemy_utils.functions import create_database, database_exists
 from starlette.testclient import TestClient
 
@@ -19,7 +23,13 @@ from fideslib.cryptography.schemas.jwt import (
     JWE_PAYLOAD_SCOPES,
 )
 from fideslib.db.base import Base
-from fideslib.db.session import get_db_engine, get_db_session
+from fideslib.db.session import (
+    get_async_db_engine,
+    get_async_db_session,
+    get_db_engine,
+    get_db_session,
+)
+from fideslib.models.audit_log import AuditLog, AuditLogAction
 from fideslib.models.client import ClientDetail
 from fideslib.models.fides_user import FidesUser
 from fideslib.models.fides_user_permissions import FidesUserPermissions
@@ -34,9 +44,7 @@ ROOT_PATH = Path().absolute()
 
 @pytest.fixture(scope="session")
 def config():
-    config = get_config()
-    config.is_test_mode = True
-    yield config
+    yield get_config().copy(update={"is_test_mode": True})
 
 
 @pytest.fixture
@@ -65,6 +73,96 @@ def db(config):
     engine.dispose()
 
 
+@pytest.fixture
+def replica_db(db, config):
+    """A session whose primary and replica are separate engines on the test DB."""
+    primary = db.get_bind()
+    replica = get_db_engine(config=config)
+    session = get_db_session(config, engine=primary, replica_engines=[replica])()
+    yield session, primary, replica
+    session.close()
+    replica.dispose()
+
+
+@pytest.fixture
+def run_async(db, config):  # pylint: disable=unused-argument
+    """Run a coroutine function against the test DB, passing it an async session.
+
+    Depends on `db` for the tables it creates.
+    """
+
+    def run(func):
+        async def main():
+            engine = get_async_db_engine(
+                database_uri=config.database.sqlalchemy_database_uri,
+            )
+            SessionLocal = get_async_db_session(config, engine=engine)
+            try:
+                async with SessionLocal() as session:
+                    return await func(session)
+            finally:
+                await engine.dispose()
+
+        return asyncio.run(main())
+
+    yield run
+
+
+@contextmanager
+def listening(target, identifier, listener):
+    """Listen for the SQLAlchemy event on the target within the block."""
+    event.listen(target, identifier, listener)
+    try:
+        yield
+    finally:
+        event.remove(target, identifier, listener)
+
+
+@pytest.fixture
+def capture_statements():
+    """Return a context manager that collects the SQL statements executed through
+    each of the engines, or the engine of a session, into a list per engine.
+    """
+
+    @contextmanager
+    def capture(*binds):
+        statements: tuple[list[str], ...] = tuple([] for _ in binds)
+        with ExitStack() as stack:
+            for bind, collected in zip(binds, statements):
+
+                def before_cursor_execute(
+                    conn, cursor, statement, *args, collected=collected
+                ):  # pylint: disable=unused-argument
+                    collected.append(statement)
+
+                engine = bind.get_bind() if isinstance(bind, Session) else bind
+                stack.enter_context(
+                    listening(engine, "before_cursor_execute", before_cursor_execute)
+                )
+            yield statements
+
+    yield capture
+
+
+@pytest.fixture
+def count_commits():
+    """Return a context manager that collects an entry for each commit of the
+    session.
+    """
+
+    @contextmanager
+    def count(session):
+        commits = []
+
+        def after_commit(session):  # pylint: disable=unused-argument
+            commits.append(True)
+
+        with listening(session, "after_commit", after_commit):
+            yield commits
+
+    yield count
+
+
 @pytest.fixture(autouse=True, scope="session")
 def env_vars():
     os.environ["TESTING"] = "True"
@@ -84,10 +182,24 @@ def fides_toml_path():
     yield ROOT_PATH / "fides.toml"
 
 
+@pytest.fixture
+def audit_logs(request, db):
+    """Create audit logs for user_0, user_1 and so on in a single statement, five
+    of them unless another number is passed with indirect parametrization.
+    """
+    yield AuditLog.bulk_create(
+        db,
+        rows=[
+            {"user_id": f"user_{i}", "action": AuditLogAction.approved}
+            for i in range(getattr(request, "param", 5))
+        ],
+    )
+
+
 @pytest.fixture
 def oauth_client(db):
     """Return a client for authentication purposes."""
-    client = ClientDetail(
+    client = ClientDetail(  # type: ignore
         hashed_secret="thisisatest",
         salt="thisisstillatest",
         scopes=SCOPES,
@@ -122,7 +234,7 @@ def user(db):
             "password": "TESTdcnG@wzJeu0&%3Qe2fGo7",
         },
     )
-    client = ClientDetail(
+    client = ClientDetail(  # type: ignore
         hashed_secret="thisisatest",
         salt="thisisstillatest",
         scopes=SCOPES,
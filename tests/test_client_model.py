@@ -1,7 +1,5 @@
 # pylint: disable=missing-function-docstring
 
-from copy import deepcopy
-
 import pytest
 
 from fideslib.cryptography.cryptographic_util import hash_with_salt
@@ -52,6 +50,30 @@ def test_get_client_root_client_no_scopes(db, config):
     assert client_detail.scopes is None
 
 
+def test_async_get_client(oauth_client, config, run_async):
+    async def get_client(session):
+        return await ClientDetail.async_get(
+            session, object_id=oauth_client.id, config=config
+        )
+
+    client = run_async(get_client)
+    assert client
+    assert client.id == oauth_client.id
+    assert client.scopes == SCOPES
+
+
+def test_async_get_client_root_client(config, run_async):
+    async def get_client(session):
+        return await ClientDetail.async_get(
+            session, object_id="fidesadmin", config=config, scopes=SCOPES
+        )
+
+    client = run_async(get_client)
+    assert client
+    assert client.id == config.security.oauth_root_client_id
+    assert client.scopes == SCOPES
+
+
 def test_credentials_valid(db, config):
     new_client, secret = ClientDetail.create_client_and_secret(
         db,
@@ -65,7 +87,32 @@ def test_credentials_valid(db, config):
 
 
 def test_get_root_client_detail_no_root_client_hash(config):
-    test_config = deepcopy(config)
-    test_config.security.oauth_root_client_secret_hash = None
+    test_config = config.copy(
+        update={
+            "security": config.security.copy(
+                update={
+                    "oauth_root_client_secret": "",
+                    "precomputed_oauth_root_client_secret_hash": None,
+                }
+            )
+        }
+    )
     with pytest.raises(ValueError):
         _get_root_client_detail(test_config, SCOPES)
+
+
+def test_get_root_client_detail_computes_root_client_hash(config):
+    test_config = config.copy(
+        update={
+            "security": config.security.copy(
+                update={"precomputed_oauth_root_client_secret_hash": None}
+            )
+        }
+    )
+    client_detail = _get_root_client_detail(test_config, SCOPES)
+
+    assert client_detail
+    assert client_detail.credentials_valid(
+        test_config.security.oauth_root_client_secret
+    )
+    assert test_config.security.oauth_root_client_secret_hash is not None
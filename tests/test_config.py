@@ -1,6 +1,7 @@
 # pylint: disable=missing-function-docstring, redefined-outer-name
 
 import os
+import shutil
 from pathlib import Path
 from unittest.mock import patch
 
@@ -11,8 +12,11 @@ from fideslib.core.config import (
     DatabaseSettings,
     SecuritySettings,
     get_config,
+    invalidate_config,
     load_toml,
+    reload_config,
 )
+from fideslib.cryptography.cryptographic_util import hash_with_salt
 from fideslib.exceptions import MissingConfig
 
 ROOT_PATH = Path().absolute()
@@ -68,6 +72,83 @@ def test_config_from_path() -> None:
     assert config.security.app_encryption_key == "atestencryptionkeythatisvalidlen"
 
 
+@pytest.fixture
+def config_path(tmp_path):
+    shutil.copy(ROOT_PATH / "tests" / "assets" / "fides.toml", tmp_path)
+    with patch.dict(os.environ, {"FIDES__CONFIG_PATH": str(tmp_path)}, clear=True):
+        yield tmp_path / "fides.toml"
+    invalidate_config()
+
+
+@pytest.mark.usefixtures("config_path")
+def test_get_config_is_cached() -> None:
+    config = get_config()
+    with patch("fideslib.core.config._load_config_snapshot") as load:
+        assert get_config() == config
+
+    load.assert_not_called()
+
+
+@pytest.mark.usefixtures("config_path")
+def test_get_config_is_immutable() -> None:
+    config = get_config()
+    with pytest.raises(TypeError):
+        config.is_test_mode = not config.is_test_mode
+    with pytest.raises(TypeError):
+        config.database.server = "changedserver"
+
+    changed = config.copy(
+        update={"database": config.database.copy(update={"server": "changedserver"})}
+    )
+    assert changed.database.server == "changedserver"
+    assert get_config() is config
+    assert config.database.server == "testserver"
+
+
+@pytest.mark.usefixtures("config_path")
+def test_get_config_cache_keyed_on_env() -> None:
+    config = get_config()
+    with patch.dict(os.environ, {"FIDES__DATABASE__SERVER": "otherserver"}):
+        other_config = get_config()
+
+    assert other_config.database.server == "otherserver"
+    assert get_config() == config
+
+
+def test_get_config_does_not_reread_file(config_path) -> None:
+    config = get_config()
+    config_path.unlink()
+
+    assert get_config() == config
+
+
+def test_invalidate_config(config_path) -> None:
+    get_config()
+    config_path.write_text(config_path.read_text().replace("testserver", "newserver"))
+    invalidate_config()
+
+    assert get_config().database.server == "newserver"
+
+
+@pytest.mark.usefixtures("config_path")
+def test_reload_config_unchanged() -> None:
+    config = get_config()
+    with patch("fideslib.core.config._load_config_snapshot") as load:
+        assert reload_config() == config
+
+    load.assert_not_called()
+
+
+def test_reload_config_file_changed(config_path) -> None:
+    get_config()
+    config_path.write_text(config_path.read_text().replace("testserver", "newserver"))
+    os.utime(config_path, (0, 0))
+
+    reloaded = reload_config()
+    assert reloaded.database.server == "newserver"
+    assert get_config() == reloaded
+
+
 def test_database_settings_sqlalchemy_database_uri_str(config_dict):
     expected = "postgresql://someuri:216f4b49bea5da4f84f05288258471852c3e325cd336821097e1e65ff92b528a@db:5432/test"
     config_dict["database"]["sqlalchemy_database_uri"] = expected
@@ -84,6 +165,85 @@ def test_database_settings_sqlalchemy_test_database_uri_str(config_dict):
     assert settings.sqlalchemy_test_database_uri == expected
 
 
+def test_database_settings_pool(config_dict):
+    with patch.dict(
+        os.environ,
+        {
+            "FIDES__DATABASE__POOL_SIZE": "20",
+            "FIDES__DATABASE__MAX_OVERFLOW": "10",
+            "FIDES__DATABASE__POOL_RECYCLE": "3600",
+            "FIDES__DATABASE__CONNECT_ARGS": '{"connect_timeout": 5}',
+        },
+    ):
+        settings = DatabaseSettings.parse_obj(config_dict["database"])
+
+    assert settings.pool_class is None
+    assert settings.pool_size == 20
+    assert settings.max_overflow == 10
+    assert settings.pool_timeout is None
+    assert settings.pool_recycle == 3600
+    assert settings.connect_args == {"connect_timeout": 5}
+
+
+def test_database_settings_replicas(config_dict):
+    with patch.dict(
+        os.environ,
+        {
+            "FIDES__DATABASE__SQLALCHEMY_REPLICA_DATABASE_URIS": '["postgresql://replica/db"]',
+            "FIDES__DATABASE__REPLICA_SELECTION": "least_connections",
+        },
+    ):
+        settings = DatabaseSettings.parse_obj(config_dict["database"])
+
+    assert settings.sqlalchemy_replica_database_uris == ["postgresql://replica/db"]
+    assert settings.replica_selection == "least_connections"
+
+
+def test_database_settings_invalid_replica_selection(config_dict):
+    config_dict["database"]["replica_selection"] = "random"
+
+    with pytest.raises(ValueError):
+        DatabaseSettings.parse_obj(config_dict["database"])
+
+
+@pytest.mark.parametrize(
+    "pool_settings",
+    [
+        {"pool_class": "NotAPool"},
+        {"pool_size": -1},
+        {"pool_timeout": -1},
+        {"max_overflow": -2},
+        {"pool_class": "NullPool", "pool_size": 5},
+        {"pool_class": "NullPool", "max_overflow": 5},
+        {"pool_class": "StaticPool", "pool_size": 5},
+        {"pool_class": "StaticPool", "pool_timeout": 5},
+        {"pool_class": "AssertionPool", "max_overflow": 5},
+        {"pool_class": "SingletonThreadPool", "max_overflow": 5},
+    ],
+)
+def test_database_settings_invalid_pool(pool_settings, config_dict):
+    config_dict["database"].update(pool_settings)
+
+    with pytest.raises(ValueError):
+        DatabaseSettings.parse_obj(config_dict["database"])
+
+
+@pytest.mark.parametrize(
+    "pool_settings",
+    [
+        {"pool_class": "QueuePool", "pool_size": 5, "max_overflow": 5},
+        {"pool_class": "SingletonThreadPool", "pool_size": 5},
+        {"pool_class": "StaticPool", "pool_recycle": 3600},
+    ],
+)
+def test_database_settings_pool_sizing(pool_settings, config_dict):
+    config_dict["database"].update(pool_settings)
+
+    settings = DatabaseSettings.parse_obj(config_dict["database"])
+    for field, value in pool_settings.items():
+        assert getattr(settings, field) == value
+
+
 @pytest.mark.parametrize(
     "file_names", ["bad.toml", ["bad.toml"], ["bad.toml", "file.toml"]]
 )
@@ -128,6 +288,68 @@ def test_security_missing_oauth_root_client_secret(config_dict):
         SecuritySettings.parse_obj(config_dict["security"])
 
 
+def test_security_root_client_secret_hash_not_computed_on_init(config_dict):
+    with patch("fideslib.core.config.hash_with_salt") as mock_hash_with_salt:
+        settings = SecuritySettings.parse_obj(config_dict["security"])
+
+    mock_hash_with_salt.assert_not_called()
+    assert settings.precomputed_oauth_root_client_secret_hash is None
+
+
+def test_security_root_client_secret_hash_computed_on_access(config_dict):
+    settings = SecuritySettings.parse_obj(config_dict["security"])
+
+    root_client_secret_hash = settings.oauth_root_client_secret_hash
+    assert root_client_secret_hash is not None
+    assert settings.get_oauth_root_client_secret_hash() == root_client_secret_hash
+
+
+def test_security_root_client_secret_hash_computed_once(config_dict):
+    first = SecuritySettings.parse_obj(config_dict["security"])
+    second = SecuritySettings.parse_obj(config_dict["security"])
+
+    root_client_secret_hash = first.get_oauth_root_client_secret_hash()
+    assert root_client_secret_hash is not None
+    assert (
+        hash_with_salt(
+            config_dict["security"]["oauth_root_client_secret"].encode("UTF-8"),
+            root_client_secret_hash[1],
+        )
+        == root_client_secret_hash[0]
+    )
+    assert second.get_oauth_root_client_secret_hash() == root_client_secret_hash
+
+
+def test_security_precomputed_root_client_secret_hash(config_dict):
+    config_dict["security"]["oauth_root_client_secret_hash"] = ["somehash", "somesalt"]
+    with patch("fideslib.core.config.hash_with_salt") as mock_hash_with_salt:
+        settings = SecuritySettings.parse_obj(config_dict["security"])
+        root_client_secret_hash = settings.get_oauth_root_client_secret_hash()
+
+    mock_hash_with_salt.assert_not_called()
+    assert root_client_secret_hash == ("somehash", b"somesalt")
+    assert settings.oauth_root_client_secret_hash == ("somehash", b"somesalt")
+
+
+def test_security_precomputed_root_client_secret_hash_env(config_dict):
+    with patch.dict(
+        os.environ,
+        {
+            "FIDES__SECURITY__OAUTH_ROOT_CLIENT_SECRET_HASH": '["somehash", "somesalt"]',
+        },
+    ):
+        settings = SecuritySettings.parse_obj(config_dict["security"])
+
+    assert settings.get_oauth_root_client_secret_hash() == ("somehash", b"somesalt")
+
+
+def test_security_invalid_root_client_secret_hash(config_dict):
+    config_dict["security"]["oauth_root_client_secret_hash"] = ["somehash"]
+
+    with pytest.raises(ValueError):
+        SecuritySettings.parse_obj(config_dict["security"])
+
+
 @pytest.mark.parametrize(
     "cors_origins, expected",
     [
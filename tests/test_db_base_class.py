@@ -1,10 +1,64 @@
-# pylint: disable=missing-function-docstring
+# pylint: disable=missing-function-docstring, redefined-outer-name
+
+from uuid import UUID
 
 import pytest
+from fastapi_pagination import Page, Params
 from fideslang.validation import FidesValidationError  # type: ignore
+from sqlalchemy import Column, ForeignKey, String, insert, inspect, select, text
+from sqlalchemy.engine import Row  # type: ignore
+from sqlalchemy.exc import StatementError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from fideslib.db import bulk, pagination
+from fideslib.db.base_class import (
+    Base,
+    CompactIdMixin,
+    PrefixedUUID,
+    VersionedMixin,
+    get_key_from_data,
+)
+from fideslib.db.cache import LRUCacheBackend
+from fideslib.db.pagination import _encode_cursor
+from fideslib.exceptions import (
+    KeyOrNameAlreadyExists,
+    KeyValidationError,
+    StaleObjectError,
+)
+from fideslib.models.audit_log import AuditLog, AuditLogAction
+from fideslib.utils.ids import generate_id, set_id_strategy, uuid7
+
+
+class KeyedModel(Base):
+    """A model with a key and a name, to exercise the key and name handling."""
+
+    key = Column(String, unique=True, nullable=False)
+    name = Column(String, unique=True)
+    description = Column(String, nullable=True)
+
+
+class CompactModel(CompactIdMixin, Base):
+    """A model storing its ID as a native UUID."""
+
+    name = Column(String)
+    parent_id = Column(PrefixedUUID("com"), ForeignKey("compactmodel.id"))
 
-from fideslib.db.base_class import get_key_from_data
-from fideslib.exceptions import KeyValidationError
+
+class VersionedModel(VersionedMixin, Base):
+    """A model with a version counter."""
+
+    name = Column(String)
+
+
+class NamePropertyModel(Base):
+    """A model with a name that isn't a column."""
+
+    description = Column(String)
+
+    @property
+    def name(self):
+        return f"Model {self.description}"
 
 
 def test_get_key_from_data():
@@ -25,3 +79,917 @@ def test_get_key_from_data_no_data():
 def test_get_key_from_data_invalid():
     with pytest.raises(FidesValidationError):
         get_key_from_data({"key": "test*key", "name": "config name"}, "StorageConfig")
+
+
+def test_uuid7_is_time_ordered():
+    uuids = [uuid7() for _ in range(10000)]
+
+    assert all(uuid.version == 7 for uuid in uuids)
+    assert len(set(uuids)) == len(uuids)
+    assert sorted(uuids) == uuids
+    assert sorted(str(uuid) for uuid in uuids) == [str(uuid) for uuid in uuids]
+
+
+def test_generate_id():
+    ids = [generate_id("auditlog") for _ in range(100)]
+
+    assert all(id_.startswith("aud_") for id_ in ids)
+    assert UUID(ids[0][4:]).version == 7
+    assert sorted(ids) == ids
+
+
+def test_generate_id_uuid4_strategy():
+    set_id_strategy("uuid4")
+    try:
+        assert UUID(generate_id("auditlog")[4:]).version == 4
+    finally:
+        set_id_strategy("uuid7")
+
+
+def test_set_id_strategy_invalid():
+    with pytest.raises(ValueError):
+        set_id_strategy("sequential")
+
+
+def test_created_ids_are_time_ordered(db):
+    audit_logs = [
+        AuditLog.create(
+            db, data={"user_id": "user_1", "action": AuditLogAction.approved}
+        )
+        for _ in range(3)
+    ]
+
+    assert [audit_log.id for audit_log in audit_logs] == sorted(
+        audit_log.id for audit_log in audit_logs
+    )
+
+
+def test_async_create_and_get(db, run_async):
+    async def create_and_get(session):
+        audit_log = await AuditLog.async_create(
+            session,
+            data={"user_id": "user_1", "action": AuditLogAction.approved},
+        )
+        return (
+            audit_log,
+            await AuditLog.async_get(session, object_id=audit_log.id),
+            await AuditLog.async_get_by(session, field="user_id", value="user_1"),
+        )
+
+    audit_log, fetched, fetched_by = run_async(create_and_get)
+
+    assert audit_log.id is not None
+    assert audit_log.created_at is not None
+    assert fetched is audit_log
+    assert fetched_by is audit_log
+    stored = AuditLog.get(db, object_id=audit_log.id)
+    assert stored is not None
+    assert stored.user_id == "user_1"
+
+
+def test_async_update_and_delete(db, run_async):
+    audit_log = AuditLog.create(
+        db, data={"user_id": "user_1", "action": AuditLogAction.approved}
+    )
+
+    async def update(session):
+        fetched = await AuditLog.async_get(session, object_id=audit_log.id)
+        assert fetched is not None
+        await fetched.async_update(session, data={"message": "updated"})
+        return await AuditLog.async_all(session)
+
+    assert [log.message for log in run_async(update)] == ["updated"]
+
+    async def delete(session):
+        fetched = await AuditLog.async_get(session, object_id=audit_log.id)
+        assert fetched is not None
+        await fetched.async_delete(session)
+        return await AuditLog.async_get(session, object_id=audit_log.id)
+
+    assert run_async(delete) is None
+
+
+def test_bulk_create(db):
+    rows = [{"name": f"Model {i}"} for i in range(5)]
+    rows.append({"key": "custom_key", "name": "Custom", "description": "custom"})
+    created = KeyedModel.bulk_create(db, rows=rows, chunk_size=2)
+
+    assert [obj.key for obj in created] == [
+        "model_0",
+        "model_1",
+        "model_2",
+        "model_3",
+        "model_4",
+        "custom_key",
+    ]
+    assert all(obj.id.startswith("key_") for obj in created)
+    assert all(obj.created_at is not None for obj in created)
+    assert created[-1].description == "custom"
+    assert KeyedModel.get(db, object_id=created[0].id) is created[0]
+    assert len(KeyedModel.all(db)) == 6
+
+
+def test_bulk_create_existing_key(db):
+    KeyedModel.create(db, data={"name": "Model"})
+
+    with pytest.raises(KeyOrNameAlreadyExists):
+        KeyedModel.bulk_create(db, rows=[{"name": "Other"}, {"name": "model"}])
+    assert len(KeyedModel.all(db)) == 1
+
+
+def test_execute_in_chunks_matches_returned_rows_by_id(db):
+    table = KeyedModel.__table__
+    rows = [
+        {"id": generate_id(table.name), "key": f"model_{i}", "name": f"Model {i}"}
+        for i in range(3)
+    ]
+
+    def build_statement(values):
+        # RETURNING makes no promise about order, so return the rows reversed
+        inserted = insert(table).values(values).returning(*table.columns).cte()
+        return select(inserted).order_by(inserted.c.key.desc())  # type: ignore
+
+    returned = KeyedModel._execute_in_chunks(  # pylint: disable=protected-access
+        db, rows, 10, build_statement
+    )
+
+    assert [row.id for row in returned] == [row["id"] for row in rows]
+
+
+def test_bulk_upsert_matches_returned_rows_by_conflict_target(db):
+    existing = KeyedModel.create(db, data={"name": "Model B"})
+    upserted = KeyedModel.bulk_upsert(
+        db,
+        rows=[{"name": "Model A"}, {"name": "Model B"}, {"name": "Model C"}],
+        conflict_target="key",
+    )
+
+    assert [obj.key for obj in upserted] == ["model_a", "model_b", "model_c"]
+    assert upserted[1] is existing
+
+
+def test_bulk_create_repeated_name(db):
+    with pytest.raises(KeyOrNameAlreadyExists):
+        KeyedModel.bulk_create(
+            db, rows=[{"key": "a", "name": "Model"}, {"key": "b", "name": "Model"}]
+        )
+    assert KeyedModel.all(db) == []
+
+
+def test_bulk_create_without_key(db):
+    created = AuditLog.bulk_create(
+        db,
+        rows=[
+            {"user_id": "user_1", "action": AuditLogAction.approved},
+            {"user_id": "user_2", "action": AuditLogAction.denied},
+        ],
+    )
+
+    assert [obj.user_id for obj in created] == ["user_1", "user_2"]
+    assert all(obj.id.startswith("aud_") for obj in created)
+
+
+def test_upsert_creates(db):
+    created = KeyedModel.upsert(db, data={"name": "Model", "description": "new"})
+
+    assert created.key == "model"
+    assert created.description == "new"
+    assert KeyedModel.get(db, object_id=created.id) is created
+
+
+def test_upsert_updates_by_key(db):
+    existing = KeyedModel.create(db, data={"name": "Model", "description": "old"})
+    updated = KeyedModel.upsert(
+        db, data={"key": "model", "name": "Model", "description": "new"}
+    )
+
+    assert updated is existing
+    assert updated.description == "new"
+    assert len(KeyedModel.all(db)) == 1
+
+
+def test_upsert_updates_by_id(db):
+    existing = KeyedModel.create(db, data={"name": "Model", "description": "old"})
+    updated = KeyedModel.upsert(
+        db, data={"id": existing.id, "name": "Renamed", "key": "renamed"}
+    )
+
+    assert updated.id == existing.id
+    assert updated.key == "renamed"
+    assert updated.name == "Renamed"
+    assert updated.description == "old"
+
+
+def test_bulk_upsert_update_columns(db):
+    KeyedModel.create(db, data={"name": "Model", "description": "old"})
+    upserted = KeyedModel.bulk_upsert(
+        db,
+        rows=[
+            {"name": "Model", "description": "new"},
+            {"name": "Other", "description": "new"},
+        ],
+        conflict_target="key",
+        update_columns=["name"],
+        chunk_size=1,
+    )
+
+    assert [obj.key for obj in upserted] == ["model", "other"]
+    assert [obj.description for obj in upserted] == ["old", "new"]
+    assert len(KeyedModel.all(db)) == 2
+
+
+def test_bulk_upsert_repeated_target(db):
+    with pytest.raises(KeyOrNameAlreadyExists):
+        KeyedModel.bulk_upsert(db, rows=[{"name": "Model"}, {"name": "model"}])
+
+
+def test_upsert_invalid_conflict_target(db):
+    with pytest.raises(ValueError):
+        KeyedModel.upsert(db, data={"name": "Model"}, conflict_target="not_a_column")
+
+
+def test_get_or_create_atomic_creates(db):
+    created, obj = KeyedModel.get_or_create_atomic(db, data={"name": "Model"})
+
+    assert created
+    assert obj.key == "model"
+    assert KeyedModel.get(db, object_id=obj.id) is obj
+
+
+def test_get_or_create_atomic_gets(db):
+    existing = KeyedModel.create(db, data={"name": "Model"})
+    created, obj = KeyedModel.get_or_create_atomic(db, data={"name": "Model"})
+
+    assert not created
+    assert obj is existing
+    assert len(KeyedModel.all(db)) == 1
+
+
+def test_get_or_create_atomic_conflict_target(db):
+    existing = KeyedModel.create(db, data={"name": "Model", "description": "old"})
+    created, obj = KeyedModel.get_or_create_atomic(
+        db, data={"name": "Model", "description": "new"}, conflict_target="key"
+    )
+
+    assert not created
+    assert obj is existing
+    assert obj.description == "old"
+
+
+def test_get_or_create_atomic_conflict_target_not_in_data(db):
+    with pytest.raises(ValueError):
+        KeyedModel.get_or_create_atomic(
+            db, data={"name": "Model"}, conflict_target="description"
+        )
+
+
+def test_get_or_create_atomic_without_unique_columns(db):
+    with pytest.raises(ValueError):
+        AuditLog.get_or_create_atomic(
+            db, data={"user_id": "user_1", "action": AuditLogAction.approved}
+        )
+
+
+def test_persist_obj_without_refresh(db, capture_statements):
+    with capture_statements(db) as (statements,):
+        audit_log = AuditLog.create(
+            db, data={"user_id": "user_1", "action": AuditLogAction.approved}
+        )
+        assert audit_log.id.startswith("aud_")
+        assert audit_log.created_at is not None
+        assert audit_log.message is None
+
+    assert [statement.split()[0] for statement in statements] == ["INSERT"]
+    assert "RETURNING" in statements[0]
+
+    created_updated_at = audit_log.updated_at
+    with capture_statements(db) as (statements,):
+        audit_log.update(db, data={"message": "updated"})
+        assert audit_log.message == "updated"
+        assert audit_log.updated_at > created_updated_at
+
+    assert [statement.split()[0] for statement in statements] == ["UPDATE"]
+    assert "RETURNING" in statements[0]
+
+
+def test_persist_obj_with_refresh(db, capture_statements):
+    with capture_statements(db) as (statements,):
+        KeyedModel.create(db, data={"name": "Model"})
+
+    assert statements[-2].startswith("INSERT")
+    assert "RETURNING" not in statements[-2]
+    assert statements[-1].startswith("SELECT")
+
+
+def test_updates_of_refreshed_models_are_batched(db, capture_statements):
+    objs = KeyedModel.bulk_create(db, rows=[{"name": f"Model {i}"} for i in range(3)])
+    for obj in objs:
+        obj.description = "updated"
+
+    with capture_statements(db) as (statements,):
+        db.commit()
+    # One executemany, as no values are fetched back with RETURNING
+    assert [statement.split()[0] for statement in statements] == ["UPDATE"]
+    assert "RETURNING" not in statements[0]
+
+
+@pytest.mark.parametrize("audit_logs", [3], indirect=True)
+def test_delete_by_ids(db, audit_logs, capture_statements):
+    with capture_statements(db) as (statements,):
+        deleted = AuditLog.delete_by_ids(
+            db, ids=[audit_logs[0].id, audit_logs[1].id, "aud_missing"]
+        )
+
+    assert deleted == 2
+    assert [statement.split()[0] for statement in statements] == ["DELETE"]
+    assert [audit_log.id for audit_log in AuditLog.all(db)] == [audit_logs[2].id]
+    assert AuditLog.get(db, object_id=audit_logs[0].id) is None
+
+
+def test_delete_by_ids_return_ids(db):
+    audit_log = AuditLog.create(
+        db, data={"user_id": "user_1", "action": AuditLogAction.approved}
+    )
+
+    assert AuditLog.delete_by_ids(
+        db, ids=[audit_log.id, "aud_missing"], return_ids=True
+    ) == [audit_log.id]
+    assert AuditLog.delete_by_ids(db, ids=[], return_ids=True) == []
+
+
+def test_paginate_keyset(db, audit_logs):
+    # Ordered by id by default
+    expected_ids = sorted(audit_log.id for audit_log in audit_logs)
+
+    ids: list[str] = []
+    cursor = None
+    pages = 0
+    while True:
+        page = AuditLog.paginate_keyset(db, after=cursor, limit=2)
+        ids.extend(audit_log.id for audit_log in page.items)
+        pages += 1
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert ids == expected_ids
+
+
+@pytest.mark.usefixtures("audit_logs")
+def test_paginate_keyset_descending_with_conditions(db):
+    first = AuditLog.paginate_keyset(
+        db,
+        order_by=[AuditLog.user_id, AuditLog.id],
+        limit=2,
+        descending=True,
+        conditions=AuditLog.user_id != "user_4",
+    )
+    assert [audit_log.user_id for audit_log in first.items] == ["user_3", "user_2"]
+
+    second = AuditLog.paginate_keyset(
+        db,
+        order_by=[AuditLog.user_id, AuditLog.id],
+        after=first.next_cursor,
+        limit=2,
+        descending=True,
+        conditions=AuditLog.user_id != "user_4",
+    )
+    assert [audit_log.user_id for audit_log in second.items] == ["user_1", "user_0"]
+    assert second.next_cursor is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        _encode_cursor(["2022-01-01T00:00:00"]),
+        _encode_cursor([1, "aud_1"]),
+        _encode_cursor(["not a date", "aud_1"]),
+    ],
+)
+def test_paginate_keyset_invalid_cursor(db, cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        AuditLog.paginate_keyset(db, order_by=("created_at", "id"), after=cursor)
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_paginate_keyset_invalid_limit(db, limit):
+    with pytest.raises(ValueError, match="Invalid limit"):
+        AuditLog.paginate_keyset(db, limit=limit)
+
+
+def test_iter_all(db, audit_logs):
+    expected_ids = {audit_log.id for audit_log in audit_logs}
+    db.expunge_all()
+
+    iterated = []
+    for audit_log in AuditLog.iter_all(db, batch_size=2):
+        assert audit_log in db
+        iterated.append(audit_log)
+
+    assert {audit_log.id for audit_log in iterated} == expected_ids
+    assert not any(audit_log in db for audit_log in iterated)
+
+
+def test_iter_all_keeps_objects_loaded_before(db, audit_logs):
+    edited, streamed_edit, *_ = audit_logs
+    edited.message = "edited"
+    db.expunge(streamed_edit)
+
+    for audit_log in AuditLog.iter_all(db, batch_size=2):
+        if audit_log.id == streamed_edit.id:
+            audit_log.message = "edited while streaming"
+
+    assert edited in db
+    db.commit()
+    db.expire_all()
+    assert edited.message == "edited"
+    fetched = AuditLog.get(db, object_id=streamed_edit.id)
+    assert fetched is not None
+    assert fetched.message == "edited while streaming"
+
+
+@pytest.mark.usefixtures("audit_logs")
+def test_iter_filter(db):
+    user_ids = [
+        audit_log.user_id
+        for audit_log in AuditLog.iter_filter(
+            db, conditions=AuditLog.user_id.in_(["user_1", "user_3"]), batch_size=1
+        )
+    ]
+    assert len(user_ids) == 2
+    assert set(user_ids) == {"user_1", "user_3"}
+
+
+@pytest.mark.parametrize("audit_logs", [4], indirect=True)
+def test_get_many(db, audit_logs, capture_statements):
+    ids = [audit_log.id for audit_log in audit_logs]
+    db.expunge(audit_logs[0])
+    db.expunge(audit_logs[2])
+
+    with capture_statements(db) as (statements,):
+        fetched = AuditLog.get_many(
+            db, object_ids=[ids[2], "aud_missing", ids[1], ids[0], ids[2]], chunk_size=1
+        )
+
+    assert [audit_log.id if audit_log else None for audit_log in fetched] == [
+        ids[2],
+        None,
+        ids[1],
+        ids[0],
+        ids[2],
+    ]
+    assert fetched[2] is audit_logs[1]
+    # Only ids not in the session are queried for, chunk_size at a time
+    assert len(statements) == 3
+
+
+def test_compact_id(db):
+    parent_id = CompactModel.create(db, data={"name": "parent"}).id
+    child_id = CompactModel.create(
+        db, data={"name": "child", "parent_id": parent_id}
+    ).id
+    db.expunge_all()
+
+    assert parent_id.startswith("com_")
+    assert UUID(parent_id[4:]).version == 7
+    parent = CompactModel.get(db, object_id=parent_id)
+    assert parent is not None
+    assert parent.name == "parent"
+    child = CompactModel.get_by(db, field="parent_id", value=parent_id)
+    assert child is not None
+    assert child.id == child_id
+    children = CompactModel.get_many(db, object_ids=[child_id])
+    assert [obj.name if obj else None for obj in children] == ["child"]
+    assert (
+        db.execute(
+            text("SELECT pg_typeof(id)::text FROM compactmodel LIMIT 1")
+        ).scalar()
+        == "uuid"
+    )
+    assert not CompactModel.__table__.indexes
+
+
+def test_compact_id_rejects_other_prefixes(db):
+    with pytest.raises(StatementError):
+        CompactModel.get(db, object_id=f"aud_{uuid7()}")
+
+
+def test_compact_id_literal(db):
+    object_id = f"com_{uuid7()}"
+    id_column = CompactModel.__table__.c.id
+    statement = select(id_column).where(id_column == object_id)  # type: ignore
+
+    compiled = statement.compile(
+        dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True}
+    )
+
+    assert f"= '{object_id[4:]}'" in str(compiled)
+
+
+def test_compact_id_bulk_write_and_pagination(db):
+    objs = CompactModel.bulk_create(
+        db, rows=[{"name": "first"}, {"name": "second"}, {"name": "third"}]
+    )
+
+    page = CompactModel.paginate_keyset(db, order_by=("id",), limit=2)
+    next_page = CompactModel.paginate_keyset(
+        db, order_by=("id",), after=page.next_cursor, limit=2
+    )
+    assert [obj.id for obj in page.items + next_page.items] == [obj.id for obj in objs]
+
+    assert CompactModel.delete_by_ids(db, ids=[objs[0].id], return_ids=True) == [
+        objs[0].id
+    ]
+    assert CompactModel.get(db, object_id=objs[0].id) is None
+
+
+def test_query_helpers_only_and_defer(db):
+    KeyedModel.create(db, data={"key": "a", "name": "A", "description": "long"})
+    db.expunge_all()
+
+    fetched = KeyedModel.get_by(db, field="key", value="a", only=["key"])
+    assert fetched is not None
+    assert inspect(fetched).unloaded >= {"name", "description"}
+    assert "key" not in inspect(fetched).unloaded
+    # Unloaded columns are still loaded when accessed
+    assert fetched.description == "long"
+    db.expunge_all()
+
+    fetched = KeyedModel.all(db, defer=["description"])[0]
+    assert inspect(fetched).unloaded & set(KeyedModel.__table__.columns.keys()) == {
+        "description"
+    }
+    db.expunge_all()
+
+    fetched = KeyedModel.filter(
+        db, conditions=KeyedModel.key == "a", only=["name"]
+    ).one()
+    assert "description" in inspect(fetched).unloaded
+    db.expunge_all()
+
+    assert (
+        "description"
+        in inspect(
+            KeyedModel.get(db, object_id=fetched.id, defer=["description"])
+        ).unloaded
+    )
+
+
+def test_query_helpers_invalid_column(db):
+    with pytest.raises(ValueError):
+        KeyedModel.all(db, only=["nonexistent"])
+
+
+def test_count(db):
+    KeyedModel.bulk_create(
+        db, rows=[{"key": f"key_{i}", "name": f"name {i}"} for i in range(5)]
+    )
+
+    assert KeyedModel.count(db) == 5
+    assert KeyedModel.count(db, conditions=KeyedModel.key == "key_1") == 1
+    # Small tables are counted exactly, even with stale statistics
+    assert KeyedModel.count(db, mode="estimate") == 5
+
+
+def test_count_estimate(db, monkeypatch, capture_statements):
+    monkeypatch.setattr(pagination, "ESTIMATED_COUNT_THRESHOLD", 1)
+    KeyedModel.bulk_create(
+        db, rows=[{"key": f"key_{i}", "name": f"name {i}"} for i in range(5)]
+    )
+    assert KeyedModel.count(db, mode="estimate") == 5
+
+    db.execute(text("ANALYZE keyedmodel"))
+    KeyedModel.create(db, data={"key": "key_5", "name": "name 5"})
+
+    with capture_statements(db) as (statements,):
+        assert KeyedModel.count(db, mode="estimate") == 5
+    assert "count" not in statements[0].lower()
+    assert KeyedModel.count(db, conditions=KeyedModel.key != "", mode="estimate") == 6
+
+
+def test_count_cached(db, monkeypatch):
+    monkeypatch.setattr(pagination, "_count_cache", LRUCacheBackend())
+    KeyedModel.create(db, data={"key": "key_1", "name": "name 1"})
+    assert KeyedModel.count(db, mode="cached") == 1
+    assert (
+        KeyedModel.count(db, conditions=KeyedModel.key == "key_2", mode="cached") == 0
+    )
+
+    KeyedModel.create(db, data={"key": "key_2", "name": "name 2"})
+
+    assert KeyedModel.count(db, mode="cached") == 1
+    assert (
+        KeyedModel.count(db, conditions=KeyedModel.key == "key_2", mode="cached") == 0
+    )
+    assert (
+        KeyedModel.count(db, conditions=KeyedModel.key == "key_1", mode="cached") == 1
+    )
+    assert KeyedModel.count(db) == 2
+
+
+def test_count_invalid_mode(db):
+    with pytest.raises(ValueError):
+        KeyedModel.count(db, mode="approximate")
+
+
+def test_paginate(db):
+    KeyedModel.bulk_create(
+        db, rows=[{"key": f"key_{i}", "name": f"name {i}"} for i in range(5)]
+    )
+
+    page = KeyedModel.paginate(
+        db,
+        params=Params(page=2, size=2),
+        conditions=KeyedModel.key != "key_0",
+        order_by=[KeyedModel.key],
+    )
+
+    assert isinstance(page, Page)
+    assert page.total == 4
+    assert [obj.key for obj in page.items] == ["key_3", "key_4"]
+
+
+def test_update_with_class_in_chunks(db, monkeypatch):
+    pauses: list[float] = []
+    monkeypatch.setattr(bulk, "sleep", pauses.append)
+    objs = KeyedModel.bulk_create(
+        db, rows=[{"key": f"key_{i}", "name": f"name {i}"} for i in range(6)]
+    )
+    progress: list[int] = []
+
+    updated_count = KeyedModel.update_with_class_in_chunks(
+        db,
+        conditions=KeyedModel.key != "key_0",
+        values={"description": "updated"},
+        chunk_size=2,
+        pause=0.5,
+        progress=progress.append,
+    )
+
+    assert updated_count == 5
+    assert progress == [2, 4, 5]
+    assert pauses == [0.5, 0.5]
+    db.expire_all()
+    assert [obj.description for obj in objs] == [None] + ["updated"] * 5
+
+
+def test_delete_all_in_chunks(db):
+    objs = KeyedModel.bulk_create(
+        db, rows=[{"key": f"key_{i}", "name": f"name {i}"} for i in range(5)]
+    )
+    progress: list[int] = []
+
+    deleted_count = KeyedModel.delete_all_in_chunks(
+        db, chunk_size=2, progress=progress.append
+    )
+
+    assert deleted_count == 5
+    assert progress == [2, 4, 5]
+    assert KeyedModel.count(db) == 0
+    assert objs[0] not in db
+    assert KeyedModel.delete_all_in_chunks(db) == 0
+
+
+def test_row_mode_reads(db):
+    objs = KeyedModel.bulk_create(
+        db,
+        rows=[
+            {"key": "key_0", "name": "name 0", "description": "first"},
+            {"key": "key_1", "name": "name 1", "description": "second"},
+        ],
+    )
+    db.expunge_all()
+
+    row = KeyedModel.get_row(db, object_id=objs[0].id, columns=["key", "description"])
+    assert isinstance(row, Row)
+    assert (row.key, row.description) == ("key_0", "first")
+    assert KeyedModel.get_row(
+        db, object_id=objs[0].id, columns=["key"], as_dict=True
+    ) == {"key": "key_0"}
+    assert KeyedModel.get_row(db, object_id="nonexistent") is None
+
+    rows = KeyedModel.filter_rows(
+        db, conditions=KeyedModel.key != "key_0", columns=["id", "name"]
+    )
+    assert [tuple(row) for row in rows] == [(objs[1].id, "name 1")]
+    assert KeyedModel.filter_rows(
+        db, columns=["key"], order_by=[KeyedModel.key.desc()], as_dicts=True
+    ) == [{"key": "key_1"}, {"key": "key_0"}]
+    assert len(db.identity_map) == 0
+
+
+def test_paginate_rows(db):
+    KeyedModel.bulk_create(
+        db, rows=[{"key": f"key_{i}", "name": f"name {i}"} for i in range(3)]
+    )
+
+    page = KeyedModel.paginate(
+        db, params=Params(page=1, size=2), order_by=[KeyedModel.key], columns=["key"]
+    )
+
+    assert isinstance(page, Page)
+    assert page.total == 3
+    assert [row.key for row in page.items] == ["key_0", "key_1"]
+
+
+@pytest.fixture
+def other_db(db):
+    """A second session on the test DB, to make concurrent writes with."""
+    session = Session(bind=db.get_bind())
+    yield session
+    session.close()
+
+
+def test_versioned_save(db, other_db):
+    obj = VersionedModel.create(db, data={"name": "original"})
+    assert obj.version_id == 1
+    concurrent = VersionedModel.get(other_db, object_id=obj.id)
+    assert concurrent is not None
+
+    obj.update(db, data={"name": "first"})
+    assert obj.version_id == 2
+
+    with pytest.raises(StaleObjectError):
+        concurrent.update(other_db, data={"name": "second"})
+
+    db.expire_all()
+    assert (obj.name, obj.version_id) == ("first", 2)
+
+    concurrent = VersionedModel.get(other_db, object_id=obj.id)
+    assert concurrent is not None
+    concurrent.update(other_db, data={"name": "second"})
+    assert concurrent.version_id == 3
+
+
+def test_versioned_delete(db, other_db):
+    obj = VersionedModel.create(db, data={"name": "original"})
+    concurrent = VersionedModel.get(other_db, object_id=obj.id)
+    assert concurrent is not None
+    obj.update(db, data={"name": "first"})
+
+    with pytest.raises(StaleObjectError):
+        concurrent.delete(other_db)
+    assert VersionedModel.get(db, object_id=obj.id) is not None
+
+
+def test_unversioned_save_of_deleted_row_raises_stale_data_error(db, other_db):
+    audit_log = AuditLog.create(
+        db, data={"user_id": "user_1", "action": AuditLogAction.approved}
+    )
+    concurrent = AuditLog.get(other_db, object_id=audit_log.id)
+    assert concurrent is not None
+    audit_log.delete(db)
+
+    with pytest.raises(StaleDataError) as exc_info:
+        concurrent.update(other_db, data={"user_id": "user_2"})
+    assert not isinstance(exc_info.value, StaleObjectError)
+
+
+def test_stale_object_error_is_a_stale_data_error(db, other_db):
+    obj = VersionedModel.create(db, data={"name": "original"})
+    concurrent = VersionedModel.get(other_db, object_id=obj.id)
+    assert concurrent is not None
+    obj.update(db, data={"name": "first"})
+
+    with pytest.raises(StaleDataError):
+        concurrent.update(other_db, data={"name": "second"})
+
+
+def test_versioned_async_save(db, run_async):
+    obj = VersionedModel.create(db, data={"name": "original"})
+
+    async def update_stale(session):
+        concurrent = await VersionedModel.async_get(session, object_id=obj.id)
+        assert concurrent is not None
+        obj.update(db, data={"name": "first"})
+        await concurrent.async_update(session, data={"name": "second"})
+
+    with pytest.raises(StaleObjectError):
+        run_async(update_stale)
+
+
+def test_versioned_bulk_writes_increment_version(db):
+    objs = VersionedModel.bulk_create(db, rows=[{"name": "a"}, {"name": "b"}])
+    assert [obj.version_id for obj in objs] == [1, 1]
+
+    VersionedModel.update_with_class(
+        db, conditions=VersionedModel.name == "a", values={"name": "c"}
+    )
+    VersionedModel.update_with_class_in_chunks(
+        db, conditions=VersionedModel.name == "c", values={"name": "d"}
+    )
+    VersionedModel.upsert(db, data={"id": objs[1].id, "name": "e"})
+    db.expire_all()
+
+    assert [(obj.name, obj.version_id) for obj in objs] == [("d", 3), ("e", 2)]
+
+
+def test_create_checks_key_and_name_in_one_query(db, capture_statements):
+    KeyedModel.create(db, data={"key": "existing_key", "name": "Existing"})
+
+    with capture_statements(db) as (statements,):
+        KeyedModel.create(db, data={"key": "new_key", "name": "New"})
+    # A single check of both the key and the name before the INSERT
+    assert "keyedmodel.key IN" in statements[0]
+    assert "keyedmodel.name IN" in statements[0]
+    assert statements[1].startswith("INSERT")
+
+    with pytest.raises(KeyOrNameAlreadyExists, match="Key existing_key"):
+        KeyedModel.create(db, data={"key": "existing_key", "name": "Other"})
+    with pytest.raises(KeyOrNameAlreadyExists, match="Name Existing"):
+        KeyedModel.create(db, data={"key": "other_key", "name": "Existing"})
+    assert KeyedModel.count(db) == 2
+
+
+def test_create_checks_key_and_name_columns(db, capture_statements):
+    with capture_statements(db) as (statements,):
+        obj = NamePropertyModel.create(db, data={"description": "a"})
+    # No name column, so nothing to check before the INSERT
+    assert statements[0].startswith("INSERT")
+    assert obj.name == "Model a"
+
+    assert NamePropertyModel.bulk_upsert(db, rows=[{"description": "b"}])
+    assert NamePropertyModel.get_or_create_atomic(
+        db, data={"id": obj.id, "description": "a"}
+    ) == (False, obj)
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda session: KeyedModel.create(session, data={"key": "a", "name": "A"}),
+        lambda session: KeyedModel.create_or_update(session, data={"key": "a"}),
+        lambda session: KeyedModel.get_or_create(session, data={"key": "a"}),
+        KeyedModel.delete_all_in_chunks,
+    ],
+)
+def test_write_helpers_read_from_primary(replica_db, capture_statements, write):
+    session, primary, replica = replica_db
+    with capture_statements(primary, replica) as (on_primary, on_replica):
+        write(session)
+
+    assert on_primary
+    assert not on_replica
+
+
+def test_exists(db):
+    KeyedModel.create(db, data={"key": "a", "name": "A"})
+
+    assert KeyedModel.exists(db, conditions=KeyedModel.key == "a")
+    assert not KeyedModel.exists(db, conditions=KeyedModel.key == "b")
+
+
+def test_async_create_existing_key_or_name(db, run_async):
+    KeyedModel.create(db, data={"key": "a", "name": "A"})
+
+    async def create(session, data):
+        return await KeyedModel.async_create(session, data=data)
+
+    with pytest.raises(KeyOrNameAlreadyExists, match="Key a"):
+        run_async(lambda session: create(session, {"key": "a", "name": "B"}))
+    with pytest.raises(KeyOrNameAlreadyExists, match="Name A"):
+        run_async(lambda session: create(session, {"key": "b", "name": "A"}))
+    assert (
+        run_async(lambda session: create(session, {"key": "b", "name": "B"})).key == "b"
+    )
+
+
+def test_get_model_metadata():
+    metadata = KeyedModel.get_model_metadata()
+
+    assert metadata is KeyedModel.get_model_metadata()
+    # updated_at is declared per model, so declarative adds it after the
+    # model's own columns
+    assert metadata.field_names == (
+        "id",
+        "created_at",
+        "key",
+        "name",
+        "description",
+        "updated_at",
+    )
+    assert metadata.optional_field_names == (
+        "created_at",
+        "name",
+        "description",
+        "updated_at",
+    )
+    assert isinstance(metadata.column_types["key"], String)
+    assert metadata.has_key and metadata.has_name
+    assert not AuditLog.get_model_metadata().has_key
+    with pytest.raises(TypeError):
+        metadata.column_types["key"] = String()  # type: ignore
+
+
+def test_get_optional_field_names():
+    names = KeyedModel.get_optional_field_names()
+    names.append("key")
+
+    assert KeyedModel.get_optional_field_names() == [
+        "created_at",
+        "name",
+        "description",
+        "updated_at",
+    ]
@@ -0,0 +1,250 @@
+# pylint: disable=missing-function-docstring, redefined-outer-name
+
+from time import sleep
+
+import pytest
+
+from fideslib.db.cache import CacheBackend, LRUCacheBackend, ModelCache
+from fideslib.db.session import get_db_engine, get_db_session
+from fideslib.models.audit_log import AuditLog, AuditLogAction
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ModelCache()
+    monkeypatch.setattr(AuditLog, "second_level_cache", cache)
+    yield cache
+
+
+class SharedBackend(CacheBackend):
+    """A dict standing in for a cache shared between processes, like Redis."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def clear(self):
+        self.values.clear()
+
+
+@pytest.fixture
+def audit_log(db):
+    yield AuditLog.create(
+        db, data={"user_id": "user_1", "action": AuditLogAction.approved}
+    )
+
+
+def test_lru_backend_evicts_least_recently_used():
+    backend = LRUCacheBackend(max_size=2)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    assert backend.get("a") == 1
+
+    backend.set("c", 3)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+    assert backend.get("c") == 3
+    assert len(backend) == 2
+
+
+def test_lru_backend_expires_values():
+    backend = LRUCacheBackend(ttl=0.01)
+    backend.set("a", 1)
+    sleep(0.02)
+    assert backend.get("a") is None
+    assert len(backend) == 0
+
+
+def test_get_is_served_from_cache_across_sessions(
+    db, cache, audit_log, capture_statements
+):
+    db.expunge_all()
+    fetched = AuditLog.get(db, object_id=audit_log.id)
+    assert fetched is not None
+    assert fetched.user_id == "user_1"
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    db.expunge_all()
+    with capture_statements(db) as (statements,):
+        fetched = AuditLog.get(db, object_id=audit_log.id)
+        assert fetched is not None
+
+    assert not statements
+    assert fetched.user_id == "user_1"
+    assert fetched in db
+    assert fetched not in db.dirty
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_ratio == 0.5
+
+
+def test_get_prefers_object_loaded_in_session(db, cache, audit_log):
+    assert AuditLog.get(db, object_id=audit_log.id) is audit_log
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_get_by_is_served_from_cache(db, cache, audit_log, capture_statements):
+    db.expunge_all()
+    AuditLog.get_by(db, field="user_id", value="user_1")
+
+    db.expunge_all()
+    with capture_statements(db) as (statements,):
+        fetched = AuditLog.get_by(db, field="user_id", value="user_1")
+        assert fetched is not None
+
+    assert not statements
+    assert fetched.id == audit_log.id
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_missing_records_are_not_cached(db, cache):
+    assert AuditLog.get(db, object_id="nonexistent") is None
+    assert AuditLog.get(db, object_id="nonexistent") is None
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+@pytest.mark.usefixtures("cache")
+def test_unflushed_changes_are_not_cached(db, audit_log):
+    audit_log.user_id = "user_2"
+    AuditLog.get_by(db, field="user_id", value="user_2")
+    db.rollback()
+    db.expunge_all()
+
+    assert AuditLog.get_by(db, field="user_id", value="user_2") is None
+
+
+def test_save_invalidates_cache(db, cache, audit_log):
+    db.expunge_all()
+    fetched = AuditLog.get(db, object_id=audit_log.id)
+    assert fetched is not None
+    fetched.update(db, data={"user_id": "user_2"})
+    db.expunge_all()
+
+    fetched = AuditLog.get(db, object_id=audit_log.id)
+    assert fetched is not None
+    assert fetched.user_id == "user_2"
+    assert AuditLog.get_by(db, field="user_id", value="user_1") is None
+    assert cache.hits == 0
+
+
+def test_delete_invalidates_cache(db, cache, audit_log):
+    AuditLog.get_by(db, field="user_id", value="user_1")
+    AuditLog.delete_with_class(db, id=audit_log.id)
+
+    assert AuditLog.get_by(db, field="user_id", value="user_1") is None
+    assert cache.hits == 0
+
+
+def test_update_with_class_invalidates_cache_on_commit(db, cache, audit_log):
+    AuditLog.update_with_class(
+        db, conditions=AuditLog.id == audit_log.id, values={"user_id": "user_2"}
+    )
+    db.expunge_all()
+    # Cached while the update is uncommitted
+    AuditLog.get(db, object_id=audit_log.id)
+    db.rollback()
+    db.expunge_all()
+
+    fetched = AuditLog.get(db, object_id=audit_log.id)
+    assert fetched is not None
+    assert fetched.user_id == "user_1"
+    assert cache.hits == 0
+
+
+@pytest.mark.usefixtures("cache")
+def test_async_save_invalidates_cache(db, audit_log, run_async):
+    AuditLog.get(db, object_id=audit_log.id)
+    db.expunge_all()
+    AuditLog.get(db, object_id=audit_log.id)
+
+    async def update(session):
+        fetched = await AuditLog.async_get(session, object_id=audit_log.id)
+        assert fetched is not None
+        await fetched.async_update(session, data={"user_id": "user_2"})
+
+    run_async(update)
+    db.expunge_all()
+
+    fetched = AuditLog.get(db, object_id=audit_log.id)
+    assert fetched is not None
+    assert fetched.user_id == "user_2"
+
+
+def test_shared_backend_is_shared_between_caches(db, monkeypatch, audit_log):
+    backend = SharedBackend()
+    first, second = ModelCache(backend), ModelCache(backend)
+
+    monkeypatch.setattr(AuditLog, "second_level_cache", first)
+    db.expunge_all()
+    AuditLog.get_by(db, field="user_id", value="user_1")
+
+    monkeypatch.setattr(AuditLog, "second_level_cache", second)
+    db.expunge_all()
+    fetched = AuditLog.get_by(db, field="user_id", value="user_1")
+    assert fetched is not None
+    assert (second.hits, second.misses) == (1, 0)
+
+    fetched.update(db, data={"user_id": "user_2"})
+
+    monkeypatch.setattr(AuditLog, "second_level_cache", first)
+    db.expunge_all()
+    assert AuditLog.get_by(db, field="user_id", value="user_1") is None
+    fetched = AuditLog.get(db, object_id=audit_log.id)
+    assert fetched is not None
+    assert fetched.user_id == "user_2"
+    assert first.hits == 0
+
+
+def test_bulk_writes_invalidate_only_their_table(db, monkeypatch, audit_log):
+    backend = SharedBackend()
+    cache = ModelCache(backend)
+    monkeypatch.setattr(AuditLog, "second_level_cache", cache)
+    db.expunge_all()
+    AuditLog.get(db, object_id=audit_log.id)
+    cache.set("other_table", ("id", "other_1"), {"id": "other_1"})
+
+    AuditLog.update_with_class(
+        db, conditions=AuditLog.id == audit_log.id, values={"user_id": "user_2"}
+    )
+    db.commit()
+    db.expunge_all()
+
+    assert cache.get("other_table", ("id", "other_1")) == {"id": "other_1"}
+    fetched = AuditLog.get(db, object_id=audit_log.id)
+    assert fetched is not None
+    assert fetched.user_id == "user_2"
+    assert cache.hits == 1
+
+
+def test_lost_generation_invalidates_table(db, cache, audit_log):
+    db.expunge_all()
+    AuditLog.get(db, object_id=audit_log.id)
+    cache.backend.delete(ModelCache.key(AuditLog.__tablename__, "generation"))
+    db.expunge_all()
+
+    AuditLog.get(db, object_id=audit_log.id)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+@pytest.mark.usefixtures("cache")
+def test_records_are_cached_from_primary(db, config, audit_log, capture_statements):
+    primary = db.get_bind()
+    replica = get_db_engine(config=config)
+    session = get_db_session(config, engine=primary, replica_engines=[replica])()
+    try:
+        with capture_statements(primary, replica) as (on_primary, on_replica):
+            assert AuditLog.get(session, object_id=audit_log.id) is not None
+            AuditLog.all(session)
+    finally:
+        session.close()
+        replica.dispose()
+
+    assert (len(on_primary), len(on_replica)) == (1, 1)
@@ -3,6 +3,7 @@
 from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy import inspect
 
 from fideslib.models.fides_user import FidesUser
 
@@ -47,3 +48,64 @@ def test_update_user_password():
     assert user.credentials_valid(new_password)
     assert user.hashed_password != new_password
     assert not user.credentials_valid(password)
+
+
+def test_credentials_are_loaded_on_access(db):
+    password = "test_password"
+    user = FidesUser.create(db=db, data={"username": "user_1", "password": password})
+    db.expunge_all()
+
+    fetched = FidesUser.get(db, object_id=user.id)
+    assert fetched is not None
+    unloaded = inspect(fetched).unloaded
+    assert {"hashed_password", "salt"} <= unloaded
+    assert "username" not in unloaded
+
+    assert fetched.credentials_valid(password)
+    assert not {"hashed_password", "salt"} & inspect(fetched).unloaded
+
+
+def test_credentials_loaded_up_front_with_async_session(db, run_async):
+    password = "test_password"
+    FidesUser.create(db=db, data={"username": "user_1", "password": password})
+
+    async def get_user(session):
+        return await FidesUser.async_get_by(
+            session,
+            field="username",
+            value="user_1",
+            undefer_group="credentials",
+        )
+
+    fetched = run_async(get_user)
+    assert not {"hashed_password", "salt"} & inspect(fetched).unloaded
+    assert fetched.credentials_valid(password)
+
+
+def test_async_get_loads_credentials_of_loaded_user(db, run_async):
+    password = "test_password"
+    user = FidesUser.create(db=db, data={"username": "user_1", "password": password})
+
+    async def get_user(session):
+        await FidesUser.async_get(session, object_id=user.id)
+        return await FidesUser.async_get(
+            session, object_id=user.id, undefer_group="credentials"
+        )
+
+    assert run_async(get_user).credentials_valid(password)
+
+
+def test_async_create_user(db, run_async):
+    password = "test_password"
+
+    async def create_user(session):
+        return await FidesUser.async_create(
+            session, data={"username": "user_1", "password": password}
+        )
+
+    user = run_async(create_user)
+    assert user.username == "user_1"
+    assert user.hashed_password != password
+    fetched = FidesUser.get(db, object_id=user.id)
+    assert fetched is not None
+    assert fetched.credentials_valid(password)
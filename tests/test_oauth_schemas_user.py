@@ -3,7 +3,8 @@
 import pytest
 
 from fideslib.cryptography.cryptographic_util import str_to_b64_str
-from fideslib.oauth.schemas.user import UserCreate, UserLogin
+from fideslib.models.fides_user import FidesUser
+from fideslib.oauth.schemas.user import UserCreate, UserLogin, UserResponse
 
 
 @pytest.mark.parametrize(
@@ -67,3 +68,13 @@ def test_user_login(password, expected):
     user = UserLogin(username="immauser", password=password)
 
     assert user.password == expected
+
+
+def test_user_response_from_row(db):
+    user = FidesUser.create(db, data={"username": "user_1", "password": "password"})
+
+    row = FidesUser.get_row(
+        db, object_id=user.id, columns=UserResponse.get_field_names()
+    )
+
+    assert UserResponse.from_orm(row) == UserResponse.from_orm(user)
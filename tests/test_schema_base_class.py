@@ -11,6 +11,16 @@ def test_get_field_names():
     assert test.get_field_names() == ["test_field"]
 
 
+def test_get_field_names_is_cached(monkeypatch):
+    class Test(FidesSchema):
+        test_field: str
+
+    Test.get_field_names().append("other_field")
+    monkeypatch.setattr(Test, "schema", None)
+
+    assert Test.get_field_names() == ["test_field"]
+
+
 def test_no_validation():
     test_value = "test"
 
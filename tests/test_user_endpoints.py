@@ -28,6 +28,7 @@ from fideslib.cryptography.schemas.jwt import (
 from fideslib.models.client import ADMIN_UI_ROOT, ClientDetail
 from fideslib.models.fides_user import FidesUser
 from fideslib.models.fides_user_permissions import FidesUserPermissions
+from fideslib.oauth.api.deps import get_db
 from fideslib.oauth.api.urn_registry import LOGIN, USER_DETAIL, USERS
 from fideslib.oauth.jwt import generate_jwe
 from fideslib.oauth.oauth_util import extract_payload
@@ -65,6 +66,16 @@ def test_create_user(body, client, db, auth_header):
     assert user.permissions is not None  # type: ignore
 
 
+@pytest.mark.parametrize("auth_header", [[USER_CREATE]], indirect=True)
+def test_create_user_rolls_back_user_if_permissions_fail(client, db, auth_header):
+    body = {"username": "test_user", "password": str_to_b64_str("TestP@ssword9")}
+    with patch.object(FidesUserPermissions, "create", side_effect=ValueError()):
+        with pytest.raises(ValueError):
+            client.post(USERS, headers=auth_header, json=body)
+
+    assert FidesUser.get_by(db, field="username", value="test_user") is None
+
+
 @pytest.mark.parametrize(
     "password, message",
     [
@@ -307,6 +318,24 @@ def test_get_users_no_users(client, auth_header):
     assert response.json()["size"] == page_size
 
 
+@pytest.mark.parametrize("auth_header", [[USER_READ]], indirect=True)
+def test_get_users_reads_from_replica(
+    client, auth_header, user, replica_db, capture_statements
+):
+    session, primary, replica = replica_db
+    client.app.dependency_overrides[get_db] = lambda: session
+    try:
+        with capture_statements(primary, replica) as (on_primary, on_replica):
+            response = client.get(USERS, headers=auth_header)
+    finally:
+        client.app.dependency_overrides.pop(get_db)
+
+    assert response.status_code == HTTP_200_OK
+    assert [item["id"] for item in response.json()["items"]] == [user.id]
+    assert not on_primary
+    assert on_replica
+
+
 @pytest.mark.parametrize("auth_header", [[USER_CREATE, USER_READ]], indirect=True)
 def test_get_users(client, auth_header, db):
     saved_users = []
@@ -486,6 +515,24 @@ def test_login_updates_last_login_date(db, user, client):
     assert user.last_login_at is not None
 
 
+def test_login_reads_from_primary(user, client, replica_db, capture_statements):
+    session, primary, replica = replica_db
+    body = {
+        "username": user.username,
+        "password": str_to_b64_str("TESTdcnG@wzJeu0&%3Qe2fGo7"),
+    }
+    client.app.dependency_overrides[get_db] = lambda: session
+    try:
+        with capture_statements(primary, replica) as (on_primary, on_replica):
+            response = client.post(LOGIN, headers={}, json=body)
+    finally:
+        client.app.dependency_overrides.pop(get_db)
+
+    assert response.status_code == HTTP_200_OK
+    assert on_primary
+    assert not on_replica
+
+
 def test_login_uses_existing_client(db, user, client, config):
     body = {
         "username": user.username,